@@ -9,11 +9,13 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import streamlit as st
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
+from sqlalchemy import Integer, func
+from sqlalchemy.orm import sessionmaker
 
-from pm.database.models import init_db, get_session, Project
-from pm.metadata import sync_to_file, PM_STATUS_FILENAME, ProjectMetadata
+from pm.database.models import init_db, get_engine, Project, PRIORITY_LABELS
 
 # Page config - must be first
 st.set_page_config(
@@ -27,106 +29,317 @@ st.set_page_config(
 st.markdown("""
 <style>
     .stExpander { border: 1px solid #ddd; border-radius: 4px; margin-bottom: 4px; }
-    .commit-msg { color: #666; font-size: 0.85em; }
 </style>
 """, unsafe_allow_html=True)
 
-# Initialize
-init_db()
-
 # Session state
-if "selected" not in st.session_state:
-    st.session_state.selected = set()
 if "page" not in st.session_state:
     st.session_state.page = 0
 
 
+PAGE_SIZE = 25
+
+
+@st.cache_resource
+def get_session_factory() -> sessionmaker:
+    """Create the engine and session factory once per server process."""
+    init_db()
+    return sessionmaker(bind=get_engine())
+
+
+@st.cache_resource
+def _last_db_version() -> dict:
+    """Process-wide record of the database version the caches were built from."""
+    return {}
+
+
+def refresh_on_db_change():
+    """Drop cached query results once the database files have been written (e.g. by `pm scan`)."""
+    get_session_factory()
+    db = Path(get_engine().url.database)
+    version = max(
+        (f.stat().st_mtime for f in (db, db.with_name(db.name + "-wal")) if f.exists()),
+        default=0.0,
+    )
+    seen = _last_db_version()
+    if seen.get("version", version) != version:
+        st.cache_data.clear()
+    seen["version"] = version
+
+# Columns the dashboard actually reads; avoids hydrating full Project objects.
+# Defaults are applied in SQL so the DataFrame needs no per-row fixups.
+PAGE_COLUMNS = (
+    Project.name,
+    Project.path,
+    func.coalesce(Project.category, "internal").label("category"),
+    func.coalesce(Project.project_type, "unknown").label("type"),
+    func.coalesce(Project.completion_pct, 0).label("completion"),
+    Project.health_score.label("health"),
+    Project.urgency_score.label("urgency"),
+    func.coalesce(Project.next_action, "").label("next_action"),
+    func.coalesce(Project.has_pending_decision, False).label("has_decision"),
+    func.coalesce(Project.git_dirty, False).label("git_dirty"),
+    Project.last_commit_date.label("last_commit"),
+    func.coalesce(Project.last_commit_msg, "").label("commit_msg"),
+    Project.last_activity,
+    func.coalesce(Project.priority, 3).label("priority"),
+    Project.deadline,
+    func.coalesce(Project.notes, "").label("notes"),
+    func.coalesce(Project.client_name, "").label("client_name"),
+)
+PAGE_COLUMN_NAMES = [c.key for c in PAGE_COLUMNS]
+
+# Compact dtypes for the cached page; all scores and priorities fit in 0-100
+PAGE_DTYPES = {
+    "completion": "float32[pyarrow]",
+    "health": "int8",
+    "urgency": "int16",
+    "priority": "int8",
+    "days_inactive": "Int16",
+    "days_to_deadline": "Int16",
+    "git_dirty": "bool",
+    "has_decision": "bool",
+    "is_overdue": "bool",
+    "category": "category",
+    "type": "category",
+    "priority_label": "category",
+}
+
+PRIORITY_ICONS = {1: "🔴", 2: "🟠", 3: "⚪", 4: "🔵", 5: "⚪"}
+
+# Health buckets: <40 red, 40-69 yellow, >=70 green
+HEALTH_BINS = np.array([40, 70])
+HEALTH_ICONS = np.array(["🔴", "🟡", "🟢"])
+
+# Project table layout: column -> config (None keeps the default rendering)
+TABLE_COLUMNS = {
+    "status": st.column_config.TextColumn("St", width="small"),
+    "name": st.column_config.TextColumn("Project"),
+    "health_icon": st.column_config.TextColumn("", width="small"),
+    "health": st.column_config.ProgressColumn("Health", format="%d", min_value=0, max_value=100),
+    "completion": st.column_config.ProgressColumn("Done", format="%.0f%%", min_value=0, max_value=100),
+    "activity": st.column_config.TextColumn("Last Activity"),
+    "last_commit": st.column_config.DatetimeColumn("Last Commit", format="MM/DD HH:mm"),
+    "commit_msg": st.column_config.TextColumn("Commit"),
+    "next_action": st.column_config.TextColumn("Next"),
+}
+
+# Sort keys exposed in the UI mapped to SQL expressions
+SORT_COLUMNS = {
+    "last_commit": Project.last_commit_date,
+    "health": Project.health_score,
+    "name": Project.name,
+    "priority": func.coalesce(Project.priority, 3),
+    "urgency": Project.urgency_score,
+}
+
+
+def _active_projects(session):
+    """Query for non-archived projects."""
+    return session.query(Project).filter(
+        (Project.archived == False) | (Project.archived == None)
+    )
+
+
+def _apply_filters(query, category: str, filter_type: str):
+    """Push the category/flag filters into the SQL WHERE clause."""
+    if category == "internal":
+        query = query.filter((Project.category == category) | (Project.category == None))
+    elif category != "All":
+        query = query.filter(Project.category == category)
+
+    if filter_type == "Dirty":
+        query = query.filter(Project.git_dirty)
+    elif filter_type == "Decisions":
+        query = query.filter(Project.has_pending_decision)
+    elif filter_type == "Overdue":
+        query = query.filter(Project.is_overdue)
+    return query
+
+
+def _format_days_ago(days: pd.Series) -> np.ndarray:
+    """Short relative labels ("Today", "3d ago", "2w ago", "4mo ago") for day counts."""
+    known = days.notna().to_numpy()
+    d = days.fillna(0).to_numpy(dtype="int64")
+    return np.select(
+        [~known, d == 0, d < 7, d < 30],
+        [
+            "—",
+            "Today",
+            np.char.add(d.astype(str), "d ago"),
+            np.char.add((d // 7).astype(str), "w ago"),
+        ],
+        default=np.char.add((d // 30).astype(str), "mo ago"),
+    )
+
+
 @st.cache_data(ttl=120)
-def load_projects():
-    """Load all projects from database with caching."""
-    session = get_session()
+def count_projects(category: str = "All", filter_type: str = "All") -> int:
+    """Number of projects matching the filters (independent of sort and page)."""
+    session = get_session_factory()()
     try:
-        projects = session.query(Project).filter(
-            (Project.archived == False) | (Project.archived == None)
-        ).all()
-
-        data = []
-        for p in projects:
-            days_inactive = None
-            if p.last_activity:
-                days_inactive = (datetime.utcnow() - p.last_activity).days
-
-            # Truncate commit message
-            commit_msg = p.last_commit_msg or ""
-            if len(commit_msg) > 60:
-                commit_msg = commit_msg[:57] + "..."
-
-            data.append({
-                "name": p.name,
-                "path": p.path,
-                "category": p.category or "internal",
-                "type": p.project_type or "unknown",
-                "completion": p.completion_pct or 0,
-                "health": p.health_score,
-                "urgency": p.urgency_score,
-                "next_action": p.next_action or "",
-                "has_decision": p.has_pending_decision or False,
-                "git_dirty": p.git_dirty or False,
-                "last_commit": p.last_commit_date,
-                "commit_msg": commit_msg,
-                "days_inactive": days_inactive,
-                "priority": p.priority or 3,
-                "priority_label": p.priority_label,
-                "deadline": p.deadline,
-                "is_overdue": p.is_overdue,
-                "days_to_deadline": p.days_until_deadline,
-                "notes": p.notes or "",
-                "client_name": p.client_name or "",
-            })
-        return pd.DataFrame(data)
+        return _apply_filters(_active_projects(session), category, filter_type).count()
     finally:
         session.close()
 
 
-def launch_claude(path: str, name: str):
-    """Launch Claude Code in iTerm2."""
-    script = f'''
+@st.cache_data(ttl=120)
+def load_projects(
+    category: str = "All",
+    filter_type: str = "All",
+    sort_col: str = "last_commit",
+    sort_asc: bool = False,
+    offset: int = 0,
+    limit: int = PAGE_SIZE,
+) -> pd.DataFrame:
+    """Load one page of projects, filtered and sorted in SQL."""
+    session = get_session_factory()()
+    try:
+        query = _apply_filters(_active_projects(session), category, filter_type)
+
+        order = SORT_COLUMNS[sort_col]
+        order = order.asc() if sort_asc else order.desc()
+        rows = (
+            query.with_entities(*PAGE_COLUMNS)
+            .order_by(order.nullslast(), Project.name)
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+
+        df = pd.DataFrame.from_records(rows, columns=PAGE_COLUMN_NAMES)
+
+        # Derived columns, computed per column rather than per row
+        now = pd.Timestamp.now(tz="UTC").tz_convert(None)
+        df["last_commit"] = pd.to_datetime(df["last_commit"])
+        df["deadline"] = pd.to_datetime(df["deadline"])
+        df["days_inactive"] = (now - pd.to_datetime(df.pop("last_activity"))).dt.days
+        df["days_to_deadline"] = (df["deadline"] - now).dt.days
+        df["is_overdue"] = df["deadline"] < now
+        df["priority_label"] = df["priority"].map(PRIORITY_LABELS).fillna("Normal")
+        df = df.astype(PAGE_DTYPES)
+
+        # Display columns for the project table
+        df["health_icon"] = HEALTH_ICONS[np.digitize(df["health"].to_numpy(), HEALTH_BINS)]
+        badges = (
+            np.where(df["git_dirty"], " ●", "")
+            + np.where(df["has_decision"], " ⚠️", "")
+            + np.where(df["is_overdue"], " ⏰", "")
+        )
+        df["status"] = df["priority"].map(PRIORITY_ICONS).fillna("⚪").to_numpy() + badges
+        df["activity"] = _format_days_ago(df["days_inactive"])
+
+        # Arrow-backed columns let st.dataframe ship the buffers without re-encoding
+        return df.convert_dtypes(dtype_backend="pyarrow")
+    finally:
+        session.close()
+
+
+@st.cache_data(ttl=120)
+def load_stats() -> dict:
+    """Aggregate portfolio stats in a single SQL query."""
+    session = get_session_factory()()
+    try:
+        row = _active_projects(session).with_entities(
+            func.count(),
+            func.avg(Project.health_score),
+            func.avg(func.coalesce(Project.completion_pct, 0)),
+            func.sum(Project.git_dirty, type_=Integer),
+            func.sum(Project.has_pending_decision, type_=Integer),
+            func.sum(Project.is_overdue, type_=Integer),
+        ).one()
+        by_category = dict(
+            _active_projects(session)
+            .with_entities(func.coalesce(Project.category, "internal"), func.count())
+            .group_by(func.coalesce(Project.category, "internal"))
+            .all()
+        )
+        return {
+            "total": row[0],
+            "avg_health": row[1] or 0,
+            "avg_completion": row[2] or 0,
+            "dirty": row[3] or 0,
+            "decisions": row[4] or 0,
+            "overdue": row[5] or 0,
+            "by_category": by_category,
+        }
+    finally:
+        session.close()
+
+
+@st.cache_data(ttl=600)
+def get_category_list() -> list[str]:
+    """Distinct categories of active projects, for the filter dropdown."""
+    session = get_session_factory()()
+    try:
+        rows = _active_projects(session).with_entities(Project.category).distinct()
+        return sorted({category or "internal" for (category,) in rows})
+    finally:
+        session.close()
+
+
+# Opens one iTerm2 tab per path argument and starts Claude in it
+LAUNCH_SCRIPT = """on run argv
     tell application "iTerm"
         activate
         tell current window
-            create tab with default profile
-            tell current session
-                write text "cd '{path}' && transcript && claude --dangerously-skip-permissions --continue"
-            end tell
+            repeat with i from 1 to count of argv
+                if i > 1 then delay 0.5
+                create tab with default profile
+                tell current session
+                    write text "cd " & quoted form of (item i of argv) & " && transcript && claude --dangerously-skip-permissions --continue"
+                end tell
+            end repeat
         end tell
     end tell
-    '''
-    subprocess.Popen(["osascript", "-e", script])
+end run
+"""
+
+
+@st.cache_resource
+def get_launch_script() -> str:
+    """Compile LAUNCH_SCRIPT once per server process; returns the script path."""
+    cache_dir = Path.home() / ".cache" / "pm"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    compiled = cache_dir / "launch.scpt"
+    try:
+        subprocess.run(["osacompile", "-o", str(compiled)], input=LAUNCH_SCRIPT,
+                       text=True, check=True, capture_output=True)
+        return str(compiled)
+    except (OSError, subprocess.CalledProcessError):
+        # osascript also runs plain source files, just without the saved compile
+        source = cache_dir / "launch.applescript"
+        source.write_text(LAUNCH_SCRIPT)
+        return str(source)
+
+
+def launch_claude(path: str, name: str):
+    """Launch Claude Code in iTerm2."""
+    launch_batch([(path, name)])
 
 
 def launch_batch(paths_names: list):
-    """Launch multiple projects."""
-    import time
-    for path, name in paths_names:
-        launch_claude(path, name)
-        time.sleep(0.5)
+    """Launch multiple projects with a single osascript call."""
+    if paths_names:
+        subprocess.Popen(["osascript", get_launch_script(), *(path for path, _ in paths_names)])
 
 
-def generate_report(report_type: str, df: pd.DataFrame):
+def generate_report(report_type: str, stats: dict):
     """Generate a report using headless Claude."""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = f"~/dev2/project-manager/reports/{report_type}_{timestamp}.md"
+    prompt_file = os.path.expanduser(f"~/dev2/project-manager/reports/{report_type}_{timestamp}.prompt.md")
 
     # Create reports directory
     os.makedirs(os.path.expanduser("~/dev2/project-manager/reports"), exist_ok=True)
 
     # Build project summary for the prompt
     if report_type == "weekly":
-        recent = df.nlargest(20, "last_commit") if "last_commit" in df.columns else df.head(20)
+        recent = load_projects(sort_col="last_commit", limit=20)
         prompt = f"""Generate a weekly project status summary report in markdown format.
 
 Projects with recent activity:
-{recent[['name', 'category', 'completion', 'health', 'commit_msg']].to_string()}
+{recent[['name', 'category', 'completion', 'health', 'commit_msg']].to_csv(index=False)}
 
 Include:
 1. Executive summary (2-3 sentences)
@@ -137,23 +350,25 @@ Include:
 Save to: {output_file}
 """
     else:  # status
+        top_urgent = load_projects(sort_col="urgency", limit=10)
         prompt = f"""Generate a comprehensive project status report in markdown format.
 
-All {len(df)} projects summary:
-- By category: {df['category'].value_counts().to_dict()}
-- Average health: {df['health'].mean():.0f}
-- Average completion: {df['completion'].mean():.0f}%
-- Projects with decisions needed: {df['has_decision'].sum()}
-- Overdue projects: {df['is_overdue'].sum()}
+All {stats['total']} projects summary:
+- By category: {stats['by_category']}
+- Average health: {stats['avg_health']:.0f}
+- Average completion: {stats['avg_completion']:.0f}%
+- Projects with decisions needed: {stats['decisions']}
+- Overdue projects: {stats['overdue']}
 
 Top 10 by urgency:
-{df.nlargest(10, 'urgency')[['name', 'priority_label', 'health', 'completion']].to_string()}
+{top_urgent[['name', 'priority_label', 'health', 'completion']].to_csv(index=False)}
 
 Save to: {output_file}
 """
 
-    # Launch headless Claude
-    cmd = f'claude -p "{prompt}" --output-format text > {output_file}'
+    # Launch headless Claude, feeding the prompt from a file rather than the command line
+    Path(prompt_file).write_text(prompt)
+    cmd = f"claude -p --output-format text < '{prompt_file}' > {output_file}"
     script = f'''
     tell application "iTerm"
         activate
@@ -169,24 +384,35 @@ Save to: {output_file}
     return output_file
 
 
+def _reset_page():
+    """Return to the first page when the filter or sort changes."""
+    st.session_state.page = 0
+
+
+def _turn_page(step: int, total_pages: int):
+    """Move the page before the rerun so a page turn costs a single run."""
+    st.session_state.page = min(max(st.session_state.page + step, 0), total_pages - 1)
+
+
 def main():
     st.title("📊 Project Manager")
+    refresh_on_db_change()
 
-    # Load data
+    # Load aggregate stats
     with st.spinner("Loading projects..."):
-        df = load_projects()
+        stats = load_stats()
 
-    if df.empty:
+    if not stats["total"]:
         st.error("No projects found. Run `pm scan ~/dev2` first.")
         return
 
     # Stats bar
     col1, col2, col3, col4, col5 = st.columns(5)
-    col1.metric("Total", len(df))
-    col2.metric("Avg Health", f"{df['health'].mean():.0f}")
-    col3.metric("Dirty", len(df[df['git_dirty'] == True]))
-    col4.metric("Decisions", len(df[df['has_decision'] == True]))
-    col5.metric("Overdue", len(df[df['is_overdue'] == True]))
+    col1.metric("Total", stats["total"])
+    col2.metric("Avg Health", f"{stats['avg_health']:.0f}")
+    col3.metric("Dirty", stats["dirty"])
+    col4.metric("Decisions", stats["decisions"])
+    col5.metric("Overdue", stats["overdue"])
 
     st.divider()
 
@@ -203,142 +429,91 @@ def main():
             "Priority ↓": ("priority", True),
             "Urgency ↓": ("urgency", False),
         }
-        sort_choice = st.selectbox("Sort", list(sort_options.keys()), label_visibility="collapsed")
+        sort_choice = st.selectbox("Sort", list(sort_options.keys()), label_visibility="collapsed",
+                                   key="sort", on_change=_reset_page)
         sort_col, sort_asc = sort_options[sort_choice]
 
     with ctrl2:
-        filter_cat = st.selectbox("Category", ["All"] + sorted(df["category"].unique().tolist()), label_visibility="collapsed")
+        filter_cat = st.selectbox("Category", ["All"] + get_category_list(), label_visibility="collapsed",
+                                  key="category", on_change=_reset_page)
 
     with ctrl3:
-        filter_type = st.selectbox("Filter", ["All", "Dirty", "Decisions", "Overdue"], label_visibility="collapsed")
+        filter_type = st.selectbox("Filter", ["All", "Dirty", "Decisions", "Overdue"], label_visibility="collapsed",
+                                   key="filter", on_change=_reset_page)
 
     with ctrl4:
         bcol1, bcol2, bcol3 = st.columns(3)
         with bcol1:
             if st.button("🚀 Top 10", use_container_width=True):
-                sorted_df = df.sort_values(sort_col, ascending=sort_asc, na_position="last").head(10)
-                launch_batch([(r["path"], r["name"]) for _, r in sorted_df.iterrows()])
+                top_df = load_projects(sort_col=sort_col, sort_asc=sort_asc, limit=10)
+                launch_batch([(r["path"], r["name"]) for _, r in top_df.iterrows()])
                 st.success("Launched 10!")
         with bcol2:
             if st.button("📊 Weekly", use_container_width=True):
-                f = generate_report("weekly", df)
+                f = generate_report("weekly", stats)
                 st.info(f"Generating: {f}")
         with bcol3:
             if st.button("📋 Status", use_container_width=True):
-                f = generate_report("status", df)
+                f = generate_report("status", stats)
                 st.info(f"Generating: {f}")
 
-    # Apply filters
-    filtered_df = df.copy()
-    if filter_cat != "All":
-        filtered_df = filtered_df[filtered_df["category"] == filter_cat]
-    if filter_type == "Dirty":
-        filtered_df = filtered_df[filtered_df["git_dirty"] == True]
-    elif filter_type == "Decisions":
-        filtered_df = filtered_df[filtered_df["has_decision"] == True]
-    elif filter_type == "Overdue":
-        filtered_df = filtered_df[filtered_df["is_overdue"] == True]
-
-    # Sort
-    filtered_df = filtered_df.sort_values(sort_col, ascending=sort_asc, na_position="last")
+    # Filter, sort and paginate in SQL - only the visible page is loaded
+    filtered_total = count_projects(filter_cat, filter_type)
+    page_df = load_projects(
+        filter_cat, filter_type, sort_col, sort_asc,
+        offset=st.session_state.page * PAGE_SIZE,
+    )
 
-    st.caption(f"Showing {len(filtered_df)} of {len(df)} projects")
+    st.caption(f"Showing {filtered_total} of {stats['total']} projects")
 
     # Pagination
-    PAGE_SIZE = 25
-    total_pages = max(1, (len(filtered_df) - 1) // PAGE_SIZE + 1)
+    total_pages = max(1, (filtered_total - 1) // PAGE_SIZE + 1)
 
     if total_pages > 1:
         pcol1, pcol2, pcol3 = st.columns([1, 2, 1])
         with pcol1:
-            if st.button("← Prev") and st.session_state.page > 0:
-                st.session_state.page -= 1
-                st.rerun()
+            st.button("← Prev", on_click=_turn_page, args=(-1, total_pages))
         with pcol2:
             st.markdown(f"<center>Page {st.session_state.page + 1} of {total_pages}</center>", unsafe_allow_html=True)
         with pcol3:
-            if st.button("Next →") and st.session_state.page < total_pages - 1:
-                st.session_state.page += 1
-                st.rerun()
-
-    # Get current page
-    start_idx = st.session_state.page * PAGE_SIZE
-    page_df = filtered_df.iloc[start_idx:start_idx + PAGE_SIZE]
-
-    # Column headers
-    hdr1, hdr2, hdr3, hdr4, hdr5, hdr6, hdr7 = st.columns([0.5, 2.5, 0.8, 0.8, 1, 1, 1.2])
-    hdr1.markdown("**St**")
-    hdr2.markdown("**Project**")
-    hdr3.markdown("**Health**")
-    hdr4.markdown("**Done**")
-    hdr5.markdown("**Last Activity**")
-    hdr6.markdown("**Last Commit**")
-    hdr7.markdown("**Actions**")
-    st.divider()
-
-    # Render projects as rows
-    for idx, row in page_df.iterrows():
-        col1, col2, col3, col4, col5, col6, col7 = st.columns([0.5, 2.5, 0.8, 0.8, 1, 1, 1.2])
-
-        # Status icons
-        health_icon = "🟢" if row["health"] >= 70 else "🟡" if row["health"] >= 40 else "🔴"
-        pri_icon = {1: "🔴", 2: "🟠", 3: "⚪", 4: "🔵", 5: "⚪"}.get(row["priority"], "⚪")
-        badges = []
-        if row["git_dirty"]:
-            badges.append("●")
-        if row["has_decision"]:
-            badges.append("⚠️")
-        if row["is_overdue"]:
-            badges.append("⏰")
-
-        col1.markdown(f"{pri_icon} {' '.join(badges)}")
-
-        # Project name with expander for details
-        with col2:
-            with st.expander(f"**{row['name']}**", expanded=False):
-                if row["commit_msg"]:
-                    st.caption(f"💬 {row['commit_msg']}")
-                st.text(f"📁 {row['path']}")
-                if row["next_action"]:
-                    st.markdown(f"**Next:** {row['next_action']}")
-                if row["notes"]:
-                    st.info(row["notes"])
-
-        # Health
-        col3.markdown(f"{health_icon} {row['health']:.0f}")
-
-        # Completion
-        col4.markdown(f"{row['completion']:.0f}%")
-
-        # Last Activity
-        if row["days_inactive"] is not None:
-            if row["days_inactive"] == 0:
-                col5.markdown("Today")
-            elif row["days_inactive"] < 7:
-                col5.markdown(f"{row['days_inactive']}d ago")
-            elif row["days_inactive"] < 30:
-                col5.markdown(f"{row['days_inactive']//7}w ago")
-            else:
-                col5.markdown(f"{row['days_inactive']//30}mo ago")
-        else:
-            col5.markdown("—")
-
-        # Last Commit
-        if pd.notna(row["last_commit"]):
-            col6.markdown(row["last_commit"].strftime("%m/%d %H:%M"))
-        else:
-            col6.markdown("—")
-
-        # Actions
-        with col7:
-            ac1, ac2, ac3 = st.columns(3)
-            if ac1.button("🚀", key=f"l_{idx}", help="Launch Claude"):
-                launch_claude(row["path"], row["name"])
-            if ac2.button("📂", key=f"v_{idx}", help="VSCode"):
-                subprocess.Popen(["code", row["path"]])
-            if ac3.button("📁", key=f"f_{idx}", help="Finder"):
-                subprocess.Popen(["open", row["path"]])
+            st.button("Next →", on_click=_turn_page, args=(1, total_pages))
+
+    # One table widget for the whole page; actions apply to the selected rows
+    event = st.dataframe(
+        page_df[list(TABLE_COLUMNS)],
+        column_config=TABLE_COLUMNS,
+        hide_index=True,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="multi-row",
+        key="project_table",
+    )
+    rows = [i for i in event.selection.rows if i < len(page_df)]
+    selected = page_df.iloc[rows]
+
+    if selected.empty:
+        st.caption("Select rows to launch, open, or view details.")
+        return
 
+    acol1, acol2, acol3 = st.columns(3)
+    if acol1.button(f"🚀 Launch ({len(selected)})", use_container_width=True, help="Launch Claude"):
+        launch_batch(list(zip(selected["path"], selected["name"])))
+    if acol2.button("📂 VSCode", use_container_width=True):
+        for path in selected["path"]:
+            subprocess.Popen(["code", path])
+    if acol3.button("📁 Finder", use_container_width=True):
+        for path in selected["path"]:
+            subprocess.Popen(["open", path])
+
+    for _, row in selected.iterrows():
+        with st.expander(f"**{row['name']}**", expanded=len(selected) == 1):
+            if row["commit_msg"]:
+                st.caption(f"💬 {row['commit_msg']}")
+            st.text(f"📁 {row['path']}")
+            if row["next_action"]:
+                st.markdown(f"**Next:** {row['next_action']}")
+            if row["notes"]:
+                st.info(row["notes"])
 
 if __name__ == "__main__":
     main()
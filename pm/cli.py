@@ -1,15 +1,18 @@
 """CLI interface for project manager."""
 
-import json
+import re
 import subprocess
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
 import click
+import orjson
+from sqlalchemy import and_, case, func, insert, or_
+from sqlalchemy.orm import selectinload
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 from rich import box
 
@@ -17,11 +20,124 @@ from .scanner.detector import ProjectDetector, ProjectInfo
 from .scanner.parser import ProgressParser, ProjectProgress, ItemStatus
 from .generator.prompts import ContinuePromptGenerator, PromptMode
 from .database.models import init_db, get_session, Project, ProgressItem, ScanHistory
-from .metadata import read_pm_status, sync_to_file, PM_STATUS_FILENAME
+from .metadata import read_pm_status, write_pm_status, ProjectMetadata, PM_STATUS_FILENAME
 
 
 console = Console()
 
+# Rich styles for table cells
+CATEGORY_STYLES = {"client": "green", "internal": "blue", "tool": "yellow"}
+PRIORITY_STYLES = {1: "red bold", 2: "yellow", 3: "white", 4: "dim", 5: "dim"}
+
+# Ten-cell bars for 0-100 values, indexed by filled cell count
+PROGRESS_BARS = tuple("█" * i + "░" * (10 - i) for i in range(11))
+
+# --filter values: "kind:value" or a bare kind such as "overdue"; like the
+# old split(":")[1], a value ends at the next colon
+FILTER_RE = re.compile(r'^(\w+)(?::([^:]+))?')
+BARE_FILTERS = {"overdue"}
+
+# Opens one iTerm2 tab per path argument and resumes Claude in it; the
+# short delay keeps iTerm from dropping tabs when opening many at once
+ITERM_TABS_SCRIPT = """on run argv
+    tell application "iTerm"
+        activate
+        tell current window
+            repeat with i from 1 to count of argv
+                if i > 1 then delay 0.3
+                create tab with default profile
+                tell current session
+                    write text "cd " & quoted form of (item i of argv) & " && transcript && claude --dangerously-skip-permissions --continue"
+                end tell
+            end repeat
+        end tell
+    end tell
+end run
+"""
+
+# Opens one Terminal window per command argument
+TERMINAL_SCRIPT = """on run argv
+    tell application "Terminal"
+        repeat with cmd in argv
+            do script (cmd as text)
+        end repeat
+    end tell
+end run
+"""
+
+# Progress items stored per project by scan
+MAX_STORED_ITEMS = 50
+
+# Max bound parameters per IN (...) clause; older SQLite builds cap a
+# statement at 999 variables
+IN_CHUNK_SIZE = 500
+
+
+def _chunks(values: list, size: int = IN_CHUNK_SIZE):
+    """Split a list into consecutive slices of at most `size` items."""
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _truncate(text: Optional[str], width: int) -> Optional[str]:
+    """Shorten text to at most `width` characters, ending in '...' if cut."""
+    if text and len(text) > width:
+        return text[:width - 3] + "..."
+    return text
+
+
+def _parse_filter(filter_str: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+    """Split a --filter value into (kind, value); (None, None) if absent or malformed.
+
+    Kinds in BARE_FILTERS take no value; every other kind needs one.
+    """
+    match = FILTER_RE.match(filter_str or "")
+    if not match:
+        return None, None
+    kind, value = match.groups()
+    if (value is None) != (kind in BARE_FILTERS):
+        return None, None
+    return kind, value
+
+
+def _find_project(query, name: str) -> Optional[Project]:
+    """Find a project by name: indexed prefix match first, then substring."""
+    return (
+        query.filter(Project.name_starts_with(name)).order_by(func.lower(Project.name)).first()
+        or query.filter(Project.name.ilike(f"%{name}%")).first()
+    )
+
+
+def _copy_to_clipboard(text: str) -> None:
+    """Copy text to the macOS clipboard, in-process when PyObjC is installed."""
+    try:
+        from AppKit import NSPasteboard
+    except ImportError:
+        subprocess.run(["pbcopy"], input=text.encode(), check=True)
+        return
+    pasteboard = NSPasteboard.generalPasteboard()
+    pasteboard.clearContents()
+    pasteboard.setString_forType_(text, "public.utf8-plain-text")
+
+
+def _load_progress(parser: ProgressParser, proj: Project) -> ProjectProgress:
+    """Get a project's progress, reusing the last scan when it is still current.
+
+    Falls back to re-parsing when files changed since the scan, or when the
+    prompt needs details scan does not store (decisions, next steps, items
+    past the storage cap).
+    """
+    project_path = Path(proj.path)
+    if (
+        proj.last_scanned is None
+        or proj.has_pending_decision
+        or not proj.next_action
+        or len(proj.items) >= MAX_STORED_ITEMS
+        or parser.files_changed_since(project_path, proj.last_scanned)
+    ):
+        return parser.parse_project(project_path)
+    return ProgressParser.from_db(proj, proj.items)
+
 
 @click.group()
 @click.version_option(version="0.1.0")
@@ -33,8 +149,13 @@ def main():
 @main.command()
 @click.argument("base_path", type=click.Path(exists=True), default="~/dev2")
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
-def scan(base_path: str, verbose: bool):
+@click.option("--force", is_flag=True, help="Re-parse every project, even if unchanged since the last scan")
+def scan(base_path: str, verbose: bool, force: bool):
     """Scan directory for projects and update database."""
+    # Only scan needs these; importing here keeps other commands' startup lean
+    from concurrent.futures import ThreadPoolExecutor
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     base_path = Path(base_path).expanduser().resolve()
 
     console.print(f"[bold blue]Scanning[/bold blue] {base_path}")
@@ -55,106 +176,194 @@ def scan(base_path: str, verbose: bool):
         projects = detector.scan()
         progress.update(task, description=f"Found {len(projects)} projects")
 
-        # Process each project
         session = get_session()
-        stats = {"new": 0, "updated": 0, "client": 0, "internal": 0, "tool": 0}
-
-        for proj_info in projects:
-            progress.update(task, description=f"Processing {proj_info.name}...")
-
-            # Parse progress
-            proj_progress = parser.parse_project(proj_info.path)
-
-            # Update database
-            proj_id = str(proj_info.path)
-            existing = session.query(Project).filter_by(id=proj_id).first()
+        session.autoflush = False
+        scanned_ids = [str(p.path) for p in projects]
+
+        # Stamp the scan before any file is checked or read, so a file edited
+        # mid-scan is newer than last_scanned and gets re-parsed next time
+        scanned_at = datetime.utcnow()
+
+        # Progress files untouched since the last scan are not re-parsed
+        last_scanned = {}
+        if not force:
+            with session.begin():
+                last_scanned = {
+                    proj_id: when
+                    for ids in _chunks(scanned_ids)
+                    for proj_id, when in session.query(Project.id, Project.last_scanned).filter(
+                        Project.id.in_(ids), Project.last_scanned.isnot(None)
+                    )
+                }
 
-            if existing:
-                stats["updated"] += 1
-                proj = existing
+        def parse(proj_info: ProjectInfo):
+            since = last_scanned.get(str(proj_info.path))
+            if since and not parser.files_changed_since(proj_info.path, since):
+                proj_progress = None
             else:
-                stats["new"] += 1
-                proj = Project(id=proj_id)
-                session.add(proj)
-
-            # Update project fields
-            proj.path = str(proj_info.path)
-            proj.name = proj_info.name
-            proj.project_type = proj_info.project_type
-            proj.category = proj_info.category
-            proj.last_scanned = datetime.utcnow()
-
-            # Progress state
-            proj.completion_pct = proj_progress.completion_pct
-            proj.current_phase = proj_progress.current_phase
-            proj.current_status = proj_progress.current_status
-            proj.current_focus = proj_progress.current_focus
-            proj.next_action = proj_progress.next_action
-            proj.has_pending_decision = proj_progress.has_pending_decision
-
-            # Git state
-            proj.git_branch = proj_info.git_branch
-            proj.git_dirty = proj_info.git_dirty
-            proj.last_commit_date = proj_info.last_commit_date
-            proj.last_commit_msg = proj_info.last_commit_msg
-            proj.last_activity = proj_info.last_commit_date
-
-            # Files
-            proj.has_claude_md = proj_info.has_claude_md
-            proj.has_todo = proj_info.has_todo
-            proj.has_progress = proj_info.has_progress
-            proj.progress_files = json.dumps(proj_info.progress_files)
-
-            # Read PM-STATUS.md metadata (if exists)
-            pm_meta = read_pm_status(proj_info.path)
-            if pm_meta:
-                # Only update if values are set in file (don't overwrite with defaults)
-                if pm_meta.priority != 3:  # Non-default priority
-                    proj.priority = pm_meta.priority
-                if pm_meta.deadline:
-                    proj.deadline = pm_meta.deadline
-                if pm_meta.target_date:
-                    proj.target_date = pm_meta.target_date
-                if pm_meta.tags:
-                    proj.tags = json.dumps(pm_meta.tags)
-                if pm_meta.client_name:
-                    proj.client_name = pm_meta.client_name
-                if pm_meta.budget_hours:
-                    proj.budget_hours = pm_meta.budget_hours
-                if pm_meta.hours_logged:
-                    proj.hours_logged = pm_meta.hours_logged
-                if pm_meta.archived:
-                    proj.archived = pm_meta.archived
-                if pm_meta.notes:
-                    proj.notes = pm_meta.notes
-
-            # Track category stats
-            stats[proj_info.category] = stats.get(proj_info.category, 0) + 1
-
-            # Update progress items
-            session.query(ProgressItem).filter_by(project_id=proj_id).delete()
-            for item in proj_progress.items[:50]:  # Limit items
-                session.add(ProgressItem(
-                    project_id=proj_id,
-                    item_type=item.item_type,
-                    content=item.content,
-                    status=item.status.value,
-                    priority=item.priority.value if item.priority else None,
-                    source_file=item.source_file,
-                    line_number=item.line_number,
-                ))
-
-            # Add history entry
-            session.add(ScanHistory(
-                project_id=proj_id,
-                completion_pct=proj_progress.completion_pct,
-                items_total=len(proj_progress.items),
-                items_complete=sum(1 for i in proj_progress.items if i.status == ItemStatus.COMPLETE),
-                items_in_progress=sum(1 for i in proj_progress.items if i.status == ItemStatus.IN_PROGRESS),
-                items_pending=sum(1 for i in proj_progress.items if i.status == ItemStatus.PENDING),
-            ))
+                proj_progress = parser.parse_project(proj_info.path)
+            return proj_progress, read_pm_status(proj_info.path)
+
+        # Reading progress files and PM-STATUS.md is I/O-bound, so overlap it
+        # across projects before the write transaction opens; the parser is
+        # stateless and safe to share
+        progress.update(task, description="Parsing progress files...")
+        with ThreadPoolExecutor(max_workers=min(32, len(projects) or 1)) as pool:
+            parsed = list(pool.map(parse, projects))
+
+        # Write everything in a single transaction; autoflush off since
+        # nothing is queried back until the bulk writes at the end
+        with session.begin():
+            stats = {"new": 0, "updated": 0, "unchanged": 0, "client": 0, "internal": 0, "tool": 0}
+            item_rows = []
+            history_rows = []
+            parsed_ids = []
+            unchanged = {}
+
+            # Load every already-known project in one query instead of one per project
+            existing_projects = {
+                p.id: p
+                for ids in _chunks(scanned_ids)
+                for p in session.query(Project).filter(Project.id.in_(ids))
+            }
+
+            for proj_info, (proj_progress, pm_meta) in zip(projects, parsed):
+                progress.update(task, description=f"Processing {proj_info.name}...")
+
+                # Update database
+                proj_id = str(proj_info.path)
+                existing = existing_projects.get(proj_id)
+
+                if existing:
+                    stats["updated"] += 1
+                    proj = existing
+                else:
+                    stats["new"] += 1
+                    proj = Project(id=proj_id)
+                    session.add(proj)
+
+                # Update project fields
+                proj.path = str(proj_info.path)
+                proj.name = proj_info.name
+                proj.project_type = proj_info.project_type
+                proj.category = proj_info.category
+                proj.last_scanned = scanned_at
+
+                # Git state
+                proj.git_branch = proj_info.git_branch
+                proj.git_dirty = proj_info.git_dirty
+                proj.last_commit_date = proj_info.last_commit_date
+                proj.last_commit_msg = proj_info.last_commit_msg
+                proj.last_activity = proj_info.last_commit_date
+
+                # Files
+                proj.has_claude_md = proj_info.has_claude_md
+                proj.has_todo = proj_info.has_todo
+                proj.has_progress = proj_info.has_progress
+                progress_files = orjson.dumps(proj_info.progress_files).decode()
+                if proj.progress_files != progress_files:
+                    proj.progress_files = progress_files
+
+                # Apply PM-STATUS.md metadata (if exists)
+                if pm_meta:
+                    # Only update if values are set in file (don't overwrite with defaults)
+                    if pm_meta.priority != 3:  # Non-default priority
+                        proj.priority = pm_meta.priority
+                    if pm_meta.deadline:
+                        proj.deadline = pm_meta.deadline
+                    if pm_meta.target_date:
+                        proj.target_date = pm_meta.target_date
+                    if pm_meta.tags:
+                        proj.tags = orjson.dumps(pm_meta.tags).decode()
+                    if pm_meta.client_name:
+                        proj.client_name = pm_meta.client_name
+                    if pm_meta.budget_hours:
+                        proj.budget_hours = pm_meta.budget_hours
+                    if pm_meta.hours_logged:
+                        proj.hours_logged = pm_meta.hours_logged
+                    if pm_meta.archived:
+                        proj.archived = pm_meta.archived
+                    if pm_meta.notes:
+                        proj.notes = pm_meta.notes
+
+                # Track category stats
+                stats[proj_info.category] = stats.get(proj_info.category, 0) + 1
+
+                # Unchanged progress files: keep the stored progress state and items
+                if proj_progress is None:
+                    stats["unchanged"] += 1
+                    unchanged[proj_id] = proj
+                    continue
+                parsed_ids.append(proj_id)
+
+                # Progress state
+                proj.completion_pct = proj_progress.completion_pct
+                proj.current_phase = proj_progress.current_phase
+                proj.current_status = proj_progress.current_status
+                proj.current_focus = proj_progress.current_focus
+                proj.next_action = proj_progress.next_action
+                proj.has_pending_decision = proj_progress.has_pending_decision
+
+                # Collect progress items and history for one bulk write after the loop
+                item_rows.extend(
+                    {
+                        "project_id": proj_id,
+                        "item_type": item.item_type,
+                        "content": item.content,
+                        "status": item.status.value,
+                        "priority": item.priority.value if item.priority else None,
+                        "source_file": item.source_file,
+                        "line_number": item.line_number,
+                    }
+                    for item in proj_progress.items[:MAX_STORED_ITEMS]
+                )
+                status_counts = Counter(i.status for i in proj_progress.items)
+                history_rows.append({
+                    "project_id": proj_id,
+                    "scanned_at": scanned_at,
+                    "completion_pct": proj_progress.completion_pct,
+                    "items_total": len(proj_progress.items),
+                    "items_complete": status_counts[ItemStatus.COMPLETE],
+                    "items_in_progress": status_counts[ItemStatus.IN_PROGRESS],
+                    "items_pending": status_counts[ItemStatus.PENDING],
+                })
+
+            # Unchanged projects still get a history row per scan, carrying
+            # forward their latest counts (stored items are capped, so they
+            # can't be recounted)
+            for ids in _chunks(list(unchanged)):
+                latest = (
+                    session.query(func.max(ScanHistory.id))
+                    .filter(ScanHistory.project_id.in_(ids))
+                    .group_by(ScanHistory.project_id)
+                )
+                previous = {
+                    h.project_id: h
+                    for h in session.query(ScanHistory).filter(ScanHistory.id.in_(latest))
+                }
+                for proj_id in ids:
+                    prev = previous.get(proj_id)
+                    history_rows.append({
+                        "project_id": proj_id,
+                        "scanned_at": scanned_at,
+                        "completion_pct": unchanged[proj_id].completion_pct,
+                        "items_total": prev.items_total if prev else None,
+                        "items_complete": prev.items_complete if prev else None,
+                        "items_in_progress": prev.items_in_progress if prev else None,
+                        "items_pending": prev.items_pending if prev else None,
+                    })
+
+            # Replace progress items and record history in bulk
+            session.flush()
+            for ids in _chunks(parsed_ids):
+                session.query(ProgressItem).filter(
+                    ProgressItem.project_id.in_(ids)
+                ).delete(synchronize_session=False)
+            if item_rows:
+                session.execute(insert(ProgressItem), item_rows)
+            if history_rows:
+                session.execute(insert(ScanHistory), history_rows)
 
-        session.commit()
         session.close()
 
     # Print summary
@@ -162,7 +371,7 @@ def scan(base_path: str, verbose: bool):
     console.print(Panel(
         f"[green]✓[/green] Scanned {len(projects)} projects\n"
         f"  • New: {stats['new']}\n"
-        f"  • Updated: {stats['updated']}\n"
+        f"  • Updated: {stats['updated']} ({stats['unchanged']} with unchanged progress files)\n"
         f"  • Client: {stats['client']}\n"
         f"  • Internal: {stats['internal']}\n"
         f"  • Tool: {stats['tool']}",
@@ -185,16 +394,14 @@ def status(filter_str: Optional[str], sort: str, limit: int, as_json: bool):
     query = session.query(Project)
 
     # Apply filters
-    if filter_str:
-        if filter_str.startswith("type:"):
-            category = filter_str.split(":")[1]
-            query = query.filter(Project.category == category)
-        elif filter_str.startswith("status:"):
-            status = filter_str.split(":")[1]
-            if status == "active":
-                query = query.filter(Project.completion_pct < 100)
-            elif status == "complete":
-                query = query.filter(Project.completion_pct >= 100)
+    kind, value = _parse_filter(filter_str)
+    if kind == "type":
+        query = query.filter(Project.category == value)
+    elif kind == "status":
+        if value == "active":
+            query = query.filter(Project.completion_pct < 100)
+        elif value == "complete":
+            query = query.filter(Project.completion_pct >= 100)
 
     # Apply sort
     if sort == "completion":
@@ -206,7 +413,19 @@ def status(filter_str: Optional[str], sort: str, limit: int, as_json: bool):
 
     if limit > 0:
         query = query.limit(limit)
-    projects = query.all()
+    # Only the displayed columns; plain rows skip ORM instance construction
+    projects = query.with_entities(
+        Project.name,
+        Project.path,
+        Project.category,
+        Project.completion_pct,
+        Project.current_phase,
+        Project.current_status,
+        Project.next_action,
+        Project.has_pending_decision,
+        Project.git_dirty,
+        Project.has_claude_md,
+    ).all()
 
     if as_json:
         data = [{
@@ -219,7 +438,9 @@ def status(filter_str: Optional[str], sort: str, limit: int, as_json: bool):
             "has_decision": p.has_pending_decision,
             "git_dirty": p.git_dirty,
         } for p in projects]
-        console.print_json(json.dumps(data, default=str))
+        # Encode once with orjson and write the bytes directly, bypassing rich
+        click.echo(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        session.close()
         return
 
     # Build table
@@ -238,35 +459,32 @@ def status(filter_str: Optional[str], sort: str, limit: int, as_json: bool):
     table.add_column("Next Action", min_width=25)
     table.add_column("", width=8)  # Flags
 
+    # Footer stats are accumulated while rendering
+    total_completion = with_decisions = dirty = 0
+
     for p in projects:
         # Progress bar
         pct = p.completion_pct or 0
-        filled = int(pct / 10)
-        bar = "█" * filled + "░" * (10 - filled)
+        total_completion += pct
+        bar = PROGRESS_BARS[min(int(pct / 10), 10)]
         pct_str = f"{bar} {pct:.0f}%" if pct else "[dim]—[/dim]"
 
         # Flags
         flags = []
         if p.has_pending_decision:
+            with_decisions += 1
             flags.append("⚠️")
         if p.git_dirty:
+            dirty += 1
             flags.append("●")
         if p.has_claude_md:
             flags.append("📄")
 
-        # Phase/Status
-        phase = p.current_phase or p.current_status or "[dim]—[/dim]"
-        if len(phase) > 25:
-            phase = phase[:22] + "..."
-
-        # Next action
-        next_act = p.next_action or "[dim]—[/dim]"
-        if len(next_act) > 30:
-            next_act = next_act[:27] + "..."
+        phase = _truncate(p.current_phase or p.current_status, 25) or "[dim]—[/dim]"
+        next_act = _truncate(p.next_action, 30) or "[dim]—[/dim]"
 
         # Category color
-        cat_colors = {"client": "green", "internal": "blue", "tool": "yellow"}
-        cat_style = cat_colors.get(p.category, "white")
+        cat_style = CATEGORY_STYLES.get(p.category, "white")
 
         table.add_row(
             p.name,
@@ -280,10 +498,7 @@ def status(filter_str: Optional[str], sort: str, limit: int, as_json: bool):
     console.print(table)
 
     # Summary stats
-    total = len(projects)
-    with_decisions = sum(1 for p in projects if p.has_pending_decision)
-    dirty = sum(1 for p in projects if p.git_dirty)
-    avg_completion = sum(p.completion_pct or 0 for p in projects) / total if total else 0
+    avg_completion = total_completion / len(projects) if projects else 0
 
     console.print()
     console.print(f"[dim]Avg completion: {avg_completion:.0f}% | "
@@ -316,9 +531,7 @@ def continue_project(
 
     # Find project(s)
     if project_name:
-        proj = session.query(Project).filter(
-            Project.name.ilike(f"%{project_name}%")
-        ).first()
+        proj = _find_project(session.query(Project).options(selectinload(Project.items)), project_name)
 
         if not proj:
             console.print(f"[red]Project not found:[/red] {project_name}")
@@ -326,19 +539,20 @@ def continue_project(
 
         projects = [proj]
     elif filter_str:
-        query = session.query(Project)
-        if filter_str.startswith("type:"):
-            category = filter_str.split(":")[1]
-            query = query.filter(Project.category == category)
+        query = session.query(Project).options(selectinload(Project.items))
+        kind, value = _parse_filter(filter_str)
+        if kind == "type":
+            query = query.filter(Project.category == value)
         projects = query.limit(10).all()
     else:
         console.print("[yellow]Specify project name or --filter[/yellow]")
         return
 
-    # Generate prompts
+    # Generate prompts; confirmed ones are opened together at the end
+    to_launch = []
     for proj in projects:
         project_path = Path(proj.path)
-        progress = parser.parse_project(project_path)
+        progress = _load_progress(parser, proj)
         prompt = generator.generate(project_path, proj.name, progress, prompt_mode)
 
         console.print(Panel(
@@ -361,190 +575,19 @@ def continue_project(
             # Copy context to clipboard
             if prompt.prompt_text:
                 try:
-                    subprocess.run(
-                        ["pbcopy"],
-                        input=prompt.prompt_text.encode(),
-                        check=True
-                    )
+                    _copy_to_clipboard(prompt.prompt_text)
                     console.print("[green]Context copied to clipboard[/green]")
                 except Exception:
                     pass
 
-            # Open in new terminal
-            cmd = f"""osascript -e 'tell application "Terminal" to do script "{prompt.command}"'"""
-            subprocess.run(cmd, shell=True)
-            console.print(f"[green]✓[/green] Launched terminal for {proj.name}")
-
-    session.close()
-
-
-@main.command()
-@click.argument("project_names", nargs=-1)
-@click.option("--filter", "-f", "filter_str", help="Filter projects: type:client, type:internal")
-@click.option("--parallel", "-p", default=1, help="Number of projects to launch in parallel")
-@click.option("--mode", "-m", default="context", type=click.Choice(["simple", "context", "decision"]))
-@click.option("--dry-run", is_flag=True, help="Show what would be launched without executing")
-@click.option("--iterm", is_flag=True, default=True, help="Use iTerm2 (default: true)")
-@click.option("--tmux", is_flag=True, help="Use tmux instead of separate windows")
-def launch(
-    project_names: tuple,
-    filter_str: Optional[str],
-    parallel: int,
-    mode: str,
-    dry_run: bool,
-    iterm: bool,
-    tmux: bool,
-):
-    """Launch Claude Code for one or more projects.
-
-    Examples:
-        pm launch remoteC                    # Launch single project
-        pm launch remoteC anterix github-spec # Launch multiple
-        pm launch --filter type:client -p 3  # Launch clients in parallel
-        pm launch --filter type:client --tmux # Use tmux session
-    """
-    init_db()
-    session = get_session()
-    parser = ProgressParser()
-    generator = ContinuePromptGenerator()
-    prompt_mode = PromptMode(mode)
-
-    # Find projects
-    if project_names:
-        projects = []
-        for name in project_names:
-            proj = session.query(Project).filter(
-                Project.name.ilike(f"%{name}%")
-            ).first()
-            if proj:
-                projects.append(proj)
-            else:
-                console.print(f"[yellow]Warning:[/yellow] Project not found: {name}")
-    elif filter_str:
-        query = session.query(Project)
-        if filter_str.startswith("type:"):
-            category = filter_str.split(":")[1]
-            query = query.filter(Project.category == category)
-            projects = query.all()
-        elif filter_str.startswith("health:"):
-            threshold = filter_str.split(":")[1]
-            all_projects = query.all()
-            if threshold == "low":
-                projects = [p for p in all_projects if p.health_score < 40]
-            elif threshold == "attention":
-                projects = [p for p in all_projects if p.health_score < 70]
-            else:
-                projects = all_projects
-        else:
-            projects = query.all()
-    else:
-        console.print("[yellow]Specify project name(s) or --filter[/yellow]")
-        console.print("Examples:")
-        console.print("  pm launch remoteC")
-        console.print("  pm launch --filter type:client")
-        console.print("  pm launch --filter health:low")
-        session.close()
-        return
-
-    if not projects:
-        console.print("[red]No projects found[/red]")
-        session.close()
-        return
-
-    console.print(f"[bold blue]Launching {len(projects)} project(s)[/bold blue]")
-
-    # Show what will be launched
-    table = Table(box=box.SIMPLE, show_header=True, header_style="bold")
-    table.add_column("Project")
-    table.add_column("Health")
-    table.add_column("Phase")
-
-    for p in projects:
-        health = p.health_score
-        health_color = "green" if health >= 70 else ("yellow" if health >= 40 else "red")
-        table.add_row(
-            p.name,
-            f"[{health_color}]{health}[/{health_color}]",
-            p.current_phase or p.current_status or "—",
-        )
-
-    console.print(table)
-
-    if dry_run:
-        console.print("\n[dim]Dry run - no terminals launched[/dim]")
-        session.close()
-        return
-
-    # Check for claudecoderun
-    claudecoderun_path = Path.home() / "dev2" / "claudecoderun"
-    use_claudecoderun = claudecoderun_path.exists()
+            to_launch.append((proj.name, prompt.command))
 
-    # Generate context files and launch
-    temp_dir = Path("/tmp/pm_launch")
-    temp_dir.mkdir(exist_ok=True)
-
-    launched = 0
-    for i, proj in enumerate(projects):
-        project_path = Path(proj.path)
-        progress = parser.parse_project(project_path)
-        prompt = generator.generate(project_path, proj.name, progress, prompt_mode)
+    # Open all confirmed projects with a single osascript process
+    if to_launch:
+        subprocess.run(["osascript", "-e", TERMINAL_SCRIPT, *(cmd for _, cmd in to_launch)])
+        for name, _ in to_launch:
+            console.print(f"[green]✓[/green] Launched terminal for {name}")
 
-        # Create temporary coderun.md with smart context
-        if prompt.prompt_text:
-            coderun_file = temp_dir / f"{proj.name}_coderun.md"
-            coderun_file.write_text(prompt.prompt_text)
-
-        if tmux:
-            # Use tmux session
-            session_name = f"claude-{proj.name}"
-            cmd = f"tmux new-session -d -s '{session_name}' -c '{project_path}' 'claude --resume || claude'"
-            if not dry_run:
-                result = subprocess.run(cmd, shell=True, capture_output=True)
-                if result.returncode == 0:
-                    console.print(f"[green]✓[/green] Launched tmux session: {session_name}")
-                    launched += 1
-                else:
-                    console.print(f"[red]✗[/red] Failed to launch {proj.name}")
-        elif use_claudecoderun and len(projects) > 1:
-            # Use claudecoderun for batch launching
-            if i == 0:  # Only launch once with all paths
-                project_paths = [p.path for p in projects]
-                # Create a temp file listing all projects
-                batch_file = temp_dir / "batch_projects.txt"
-                batch_file.write_text("\n".join(project_paths))
-
-                run_script = claudecoderun_path / "run.sh"
-                if run_script.exists():
-                    cmd_parts = [str(run_script)]
-                    cmd_parts.extend(project_paths)
-                    if parallel > 1:
-                        cmd_parts.extend(["--parallel", "--max-parallel", str(parallel)])
-                    cmd_parts.append("--delay=2")
-
-                    console.print(f"\n[dim]Calling claudecoderun with {len(projects)} projects[/dim]")
-                    subprocess.Popen(cmd_parts, cwd=claudecoderun_path)
-                    launched = len(projects)
-                break
-        else:
-            # Use iTerm2 directly via AppleScript
-            script_path = Path(__file__).parent.parent / "scripts" / "claude-launch.sh"
-            if script_path.exists():
-                subprocess.Popen([str(script_path), proj.name])
-                console.print(f"[green]✓[/green] Launched iTerm2 for {proj.name}")
-                launched += 1
-            else:
-                # Fallback to basic Terminal
-                cmd = f'''osascript -e 'tell application "Terminal" to do script "cd {project_path} && claude --resume || claude"' '''
-                subprocess.run(cmd, shell=True)
-                console.print(f"[green]✓[/green] Launched Terminal for {proj.name}")
-                launched += 1
-
-        # Delay between launches if parallel is 1
-        if parallel == 1 and i < len(projects) - 1:
-            import time
-            time.sleep(1)
-
-    console.print(f"\n[bold green]Launched {launched} project(s)[/bold green]")
     session.close()
 
 
@@ -569,22 +612,24 @@ def summary():
     init_db()
     session = get_session()
 
-    total = session.query(Project).count()
-    clients = session.query(Project).filter_by(category="client").count()
-    internal = session.query(Project).filter_by(category="internal").count()
-    tools = session.query(Project).filter_by(category="tool").count()
-
-    decisions = session.query(Project).filter_by(has_pending_decision=True).count()
-    dirty = session.query(Project).filter_by(git_dirty=True).count()
-
-    # Completion buckets
-    complete = session.query(Project).filter(Project.completion_pct >= 90).count()
-    progress = session.query(Project).filter(
-        Project.completion_pct >= 25,
-        Project.completion_pct < 90
-    ).count()
-    early = session.query(Project).filter(Project.completion_pct < 25).count()
-    unknown = session.query(Project).filter(Project.completion_pct.is_(None)).count()
+    def count_if(*conditions):
+        return func.coalesce(func.sum(case((and_(*conditions), 1), else_=0)), 0)
+
+    # All counts in a single pass over the projects table
+    (total, clients, internal, tools, decisions, dirty,
+     complete, progress, early, unknown) = session.query(
+        func.count(Project.id),
+        count_if(Project.category == "client"),
+        count_if(Project.category == "internal"),
+        count_if(Project.category == "tool"),
+        count_if(Project.has_pending_decision),
+        count_if(Project.git_dirty),
+        # Completion buckets
+        count_if(Project.completion_pct >= 90),
+        count_if(Project.completion_pct >= 25, Project.completion_pct < 90),
+        count_if(Project.completion_pct < 25),
+        count_if(Project.completion_pct.is_(None)),
+    ).one()
 
     console.print(Panel(
         f"[bold]Total Projects:[/bold] {total}\n\n"
@@ -619,20 +664,26 @@ def health(filter_str: Optional[str], limit: int, asc: bool):
     query = session.query(Project)
 
     # Apply filters
-    if filter_str:
-        if filter_str.startswith("type:"):
-            category = filter_str.split(":")[1]
-            query = query.filter(Project.category == category)
-
-    projects = query.all()
-
-    # Calculate health scores and sort
-    projects_with_health = [(p, p.health_score) for p in projects]
-    projects_with_health.sort(key=lambda x: x[1], reverse=not asc)
-
-    # Limit
+    kind, value = _parse_filter(filter_str)
+    if kind == "type":
+        query = query.filter(Project.category == value)
+
+    # Score, sort and limit in SQL, fetching only the displayed columns
+    score = Project.health_score
+    query = query.with_entities(
+        Project.name,
+        Project.category,
+        Project.project_type,
+        Project.completion_pct,
+        Project.last_activity,
+        Project.has_pending_decision,
+        Project.git_dirty,
+        Project.has_claude_md,
+        score.label("health"),
+    ).order_by(score.asc() if asc else score.desc(), Project.name)
     if limit > 0:
-        projects_with_health = projects_with_health[:limit]
+        query = query.limit(limit)
+    projects = query.all()
 
     # Build table
     table = Table(
@@ -649,23 +700,24 @@ def health(filter_str: Optional[str], limit: int, asc: bool):
     table.add_column("Activity", width=12)
     table.add_column("Issues", min_width=20)
 
-    for p, score in projects_with_health:
+    now = datetime.utcnow()
+    for p in projects:
+        score = p.health
         # Health bar
-        filled = int(score / 10)
         if score >= 70:
             color = "green"
         elif score >= 40:
             color = "yellow"
         else:
             color = "red"
-        health_bar = f"[{color}]{'█' * filled}{'░' * (10 - filled)}[/{color}] {score}"
+        health_bar = f"[{color}]{PROGRESS_BARS[min(score // 10, 10)]}[/{color}] {score}"
 
         # Completion
         comp = f"{p.completion_pct:.0f}%" if p.completion_pct else "—"
 
         # Last activity
         if p.last_activity:
-            days = (datetime.utcnow() - p.last_activity).days
+            days = (now - p.last_activity).days
             if days == 0:
                 activity = "today"
             elif days == 1:
@@ -690,8 +742,7 @@ def health(filter_str: Optional[str], limit: int, asc: bool):
         if p.project_type == 'generic':
             issues.append("? generic type")
 
-        cat_colors = {"client": "green", "internal": "blue", "tool": "yellow"}
-        cat_style = cat_colors.get(p.category, "white")
+        cat_style = CATEGORY_STYLES.get(p.category, "white")
 
         table.add_row(
             p.name,
@@ -705,7 +756,7 @@ def health(filter_str: Optional[str], limit: int, asc: bool):
     console.print(table)
 
     # Summary
-    avg_health = sum(h for _, h in projects_with_health) / len(projects_with_health) if projects_with_health else 0
+    avg_health = sum(p.health for p in projects) / len(projects) if projects else 0
     console.print(f"\n[dim]Average health: {avg_health:.0f}/100[/dim]")
 
     session.close()
@@ -738,9 +789,7 @@ def edit(project_name: str, notes: Optional[str], deadline: Optional[str],
     session = get_session()
 
     # Find project
-    project = session.query(Project).filter(
-        Project.name.ilike(f"%{project_name}%")
-    ).first()
+    project = _find_project(session.query(Project), project_name)
 
     if not project:
         console.print(f"[red]Project '{project_name}' not found[/red]")
@@ -763,7 +812,8 @@ def edit(project_name: str, notes: Optional[str], deadline: Optional[str],
         table.add_row("Client", project.client_name or "—")
         table.add_row("Budget Hours", f"{project.budget_hours:.1f}" if project.budget_hours else "—")
         table.add_row("Hours Logged", f"{project.hours_logged:.1f}" if project.hours_logged else "0")
-        table.add_row("Tags", ", ".join(project.tags_list) if project.tags_list else "—")
+        tags_list = project.tags_list
+        table.add_row("Tags", ", ".join(tags_list) if tags_list else "—")
         table.add_row("Archived", "Yes" if project.archived else "No")
         table.add_row("Notes", project.notes[:100] + "..." if project.notes and len(project.notes) > 100 else (project.notes or "—"))
 
@@ -806,7 +856,7 @@ def edit(project_name: str, notes: Optional[str], deadline: Optional[str],
 
     if tags is not None:
         tag_list = [t.strip() for t in tags.split(",") if t.strip()]
-        project.tags = json.dumps(tag_list)
+        project.tags = orjson.dumps(tag_list).decode()
         updated.append("tags")
 
     if client is not None:
@@ -829,9 +879,9 @@ def edit(project_name: str, notes: Optional[str], deadline: Optional[str],
         session.commit()
         console.print(f"[green]✓ Updated {project.name}:[/green] {', '.join(updated)}")
 
-        # Sync to PM-STATUS.md file
+        # Sync to PM-STATUS.md file; every field comes from the DB row, so
+        # the file is written directly without reading and merging it first
         if sync:
-            from .metadata import ProjectMetadata
             meta = ProjectMetadata(
                 priority=project.priority or 3,
                 deadline=project.deadline,
@@ -843,7 +893,7 @@ def edit(project_name: str, notes: Optional[str], deadline: Optional[str],
                 archived=project.archived or False,
                 notes=project.notes or "",
             )
-            if sync_to_file(Path(project.path), **vars(meta)):
+            if write_pm_status(Path(project.path), meta):
                 console.print(f"[green]✓ Synced to[/green] {PM_STATUS_FILENAME}")
             else:
                 console.print(f"[yellow]⚠ Could not write {PM_STATUS_FILENAME}[/yellow]")
@@ -862,25 +912,24 @@ def urgent(filter_str: Optional[str], limit: int):
     query = session.query(Project).filter(Project.archived == False)
 
     # Apply filters
-    if filter_str:
-        if filter_str.startswith("type:"):
-            category = filter_str.split(":")[1]
-            query = query.filter(Project.category == category)
-        elif filter_str.startswith("priority:"):
-            p = int(filter_str.split(":")[1])
-            query = query.filter(Project.priority == p)
-        elif filter_str == "overdue":
-            query = query.filter(Project.deadline < datetime.utcnow())
-        elif filter_str.startswith("tagged:"):
-            tag = filter_str.split(":")[1]
-            query = query.filter(Project.tags.ilike(f"%{tag}%"))
-
-    projects = query.all()
-
-    # Sort by urgency
-    projects_sorted = sorted(projects, key=lambda p: p.urgency_score, reverse=True)
+    kind, value = _parse_filter(filter_str)
+    if kind == "type":
+        query = query.filter(Project.category == value)
+    elif kind == "priority":
+        query = query.filter(Project.priority == int(value))
+    elif kind == "overdue":
+        query = query.filter(Project.deadline < datetime.utcnow())
+    elif kind == "tagged":
+        query = query.filter(Project.tags.ilike(f"%{value}%"))
+
+    # Score and sort by urgency in SQL; each row comes back with its score
+    query = query.add_columns(Project.urgency_score).order_by(
+        Project.urgency_score.desc(), Project.name
+    )
     if limit > 0:
-        projects_sorted = projects_sorted[:limit]
+        query = query.limit(limit)
+
+    projects_sorted = query.all()
 
     if not projects_sorted:
         console.print("[yellow]No urgent projects found[/yellow]")
@@ -896,10 +945,9 @@ def urgent(filter_str: Optional[str], limit: int):
     table.add_column("Progress")
     table.add_column("Notes")
 
-    for p in projects_sorted:
+    for p, urgency in projects_sorted:
         # Priority styling
-        priority_colors = {1: "red bold", 2: "yellow", 3: "white", 4: "dim", 5: "dim"}
-        priority_style = priority_colors.get(p.priority, "white")
+        priority_style = PRIORITY_STYLES.get(p.priority, "white")
 
         # Deadline styling
         days = p.days_until_deadline
@@ -918,7 +966,6 @@ def urgent(filter_str: Optional[str], limit: int):
             days_str = "—"
 
         # Urgency bar
-        urgency = p.urgency_score
         bar_filled = int(urgency / 10)
         bar = f"[red]{'█' * bar_filled}[/red][dim]{'░' * (10 - bar_filled)}[/dim] {urgency}"
 
@@ -984,31 +1031,49 @@ def backlog(limit: int):
 
 
 @main.command()
-@click.argument("target", default="10")
+@click.argument("targets", nargs=-1)
+@click.option("--filter", "-f", "filter_str", help="Filter projects: type:client, health:low, health:attention")
 @click.option("--dirty-only", "-d", is_flag=True, help="Only projects with uncommitted changes")
+@click.option("--parallel", "-p", default=1, help="Hand off to claudecoderun with N parallel sessions")
 @click.option("--dry-run", is_flag=True, help="Show what would be launched without launching")
-def launch(target: str, dirty_only: bool, dry_run: bool):
+@click.option("--tmux", is_flag=True, help="Start detached tmux sessions instead of iTerm2 tabs")
+def launch(targets: tuple, filter_str: Optional[str], dirty_only: bool, parallel: int, dry_run: bool,
+           tmux: bool):
     """Launch Claude Code for projects.
 
-    TARGET can be:
+    TARGETS can be:
     - A number: Launch the N most recently modified projects
-    - A project name: Launch that specific project
+    - One or more project names: Launch those projects
 
     Opens iTerm2 tabs with Claude Code using --dangerously-skip-permissions --continue.
 
     Examples:
-        pm launch              # Launch top 10 most recent
-        pm launch 5            # Launch top 5 most recent
-        pm launch myproject    # Launch specific project by name
-        pm launch -d           # Only projects with uncommitted changes
+        pm launch 5                          # Launch top 5 most recent
+        pm launch -d                         # Top 10 with uncommitted changes
+        pm launch myproject                  # Launch specific project by name
+        pm launch proj1 proj2 proj3          # Launch multiple
+        pm launch --filter type:client       # Launch all client projects
+        pm launch --filter health:low        # Launch projects scoring under 40
+        pm launch -p 3 proj1 proj2 proj3     # Run via claudecoderun, 3 at a time
+        pm launch --tmux proj1 proj2         # One detached tmux session each
     """
+    count = int(targets[0]) if len(targets) == 1 and targets[0].isdigit() else None
+    if not targets and not filter_str:
+        if not dirty_only:
+            console.print("[yellow]Specify a count, project name(s) or --filter[/yellow]")
+            console.print("Examples:")
+            console.print("  pm launch 10")
+            console.print("  pm launch myproject")
+            console.print("  pm launch --filter type:client")
+            console.print("  pm launch -d")
+            return
+        count = 10
+
     init_db()
     session = get_session()
 
-    # Check if target is a number or project name
-    try:
-        count = int(target)
-        # It's a number - launch top N
+    if count is not None:
+        # Top N most recent
         query = session.query(Project).filter(
             (Project.archived == False) | (Project.archived == None)
         ).order_by(Project.last_activity.desc().nullslast())
@@ -1017,18 +1082,36 @@ def launch(target: str, dirty_only: bool, dry_run: bool):
             query = query.filter(Project.git_dirty == True)
 
         projects = query.limit(count).all()
-    except ValueError:
-        # It's a project name - find and launch it
-        project = session.query(Project).filter(
-            Project.name.ilike(f"%{target}%")
-        ).first()
-
-        if not project:
-            console.print(f"[red]Project '{target}' not found[/red]")
-            session.close()
-            return
-
-        projects = [project]
+    elif targets:
+        # One indexed prefix query for all names; only names it misses fall
+        # back to a substring search
+        query = session.query(Project)
+        candidates = query.filter(
+            or_(*(Project.name_starts_with(name) for name in targets))
+        ).order_by(func.lower(Project.name)).all()
+        projects = []
+        for name in targets:
+            needle = name.lower()
+            proj = next((p for p in candidates if p.name.lower().startswith(needle)), None)
+            if proj is None:
+                proj = query.filter(Project.name.ilike(f"%{name}%")).first()
+            if proj:
+                projects.append(proj)
+            else:
+                console.print(f"[yellow]Warning:[/yellow] Project not found: {name}")
+    else:
+        query = session.query(Project)
+        kind, value = _parse_filter(filter_str)
+        if kind == "type":
+            query = query.filter(Project.category == value)
+        elif kind == "health":
+            if value == "low":
+                query = query.filter(Project.health_score < 40)
+            elif value == "attention":
+                query = query.filter(Project.health_score < 70)
+        if dirty_only:
+            query = query.filter(Project.git_dirty == True)
+        projects = query.order_by(func.lower(Project.name)).all()
 
     if not projects:
         console.print("[yellow]No projects found matching criteria[/yellow]")
@@ -1036,14 +1119,18 @@ def launch(target: str, dirty_only: bool, dry_run: bool):
         return
 
     # Display what we're launching
-    table = Table(title=f"Launching {len(projects)} Projects", box=box.SIMPLE)
+    console.print(f"[bold blue]Launching {len(projects)} project(s)[/bold blue]")
+    table = Table(box=box.SIMPLE)
     table.add_column("#", style="dim")
     table.add_column("Project")
+    table.add_column("Health")
     table.add_column("Last Activity")
     table.add_column("Status")
     table.add_column("Path")
 
     for i, p in enumerate(projects, 1):
+        health = p.health_score
+        health_color = "green" if health >= 70 else ("yellow" if health >= 40 else "red")
         activity = p.last_activity.strftime("%Y-%m-%d %H:%M") if p.last_activity else "—"
         status_parts = []
         if p.git_dirty:
@@ -1052,7 +1139,9 @@ def launch(target: str, dirty_only: bool, dry_run: bool):
             status_parts.append("[red]⚠[/red]")
         status = " ".join(status_parts) or "[green]✓[/green]"
 
-        table.add_row(str(i), p.name, activity, status, str(p.path))
+        table.add_row(
+            str(i), p.name, f"[{health_color}]{health}[/{health_color}]", activity, status, str(p.path)
+        )
 
     console.print(table)
 
@@ -1061,33 +1150,56 @@ def launch(target: str, dirty_only: bool, dry_run: bool):
         session.close()
         return
 
+    if tmux:
+        # tmux returns as soon as each detached session exists, so there is
+        # nothing to pace between projects
+        launched = 0
+        for p in projects:
+            session_name = f"claude-{p.name}"
+            result = subprocess.run(
+                ["tmux", "new-session", "-d", "-s", session_name, "-c", str(p.path),
+                 "claude --resume || claude"],
+                capture_output=True,
+            )
+            if result.returncode == 0:
+                console.print(f"[green]✓[/green] Launched tmux session: {session_name}")
+                launched += 1
+            else:
+                console.print(f"[red]✗[/red] Failed to launch {p.name}")
+        console.print(f"\n[bold green]Launched {launched} project(s)[/bold green]")
+        session.close()
+        return
+
+    paths = [str(p.path) for p in projects]
+    run_script = Path.home() / "dev2" / "claudecoderun" / "run.sh"
+    if parallel > 1 and run_script.exists():
+        # claudecoderun paces the sessions itself
+        console.print(f"\n[dim]Calling claudecoderun with {len(projects)} projects[/dim]")
+        subprocess.Popen(
+            [str(run_script), *paths, "--parallel", "--max-parallel", str(parallel), "--delay=2"],
+            cwd=run_script.parent,
+        )
+        console.print(f"\n[bold green]Launched {len(projects)} project(s)[/bold green]")
+        session.close()
+        return
+
     # Launch each project in iTerm2
     console.print(f"\n[bold blue]Opening {len(projects)} iTerm2 tabs...[/bold blue]")
 
-    for i, p in enumerate(projects):
-        # AppleScript to open new iTerm tab and run claude
-        script = f'''
-        tell application "iTerm"
-            activate
-            tell current window
-                create tab with default profile
-                tell current session
-                    write text "cd '{p.path}' && transcript && claude --dangerously-skip-permissions --continue"
-                end tell
-            end tell
-        end tell
-        '''
+    # One osascript process opens every tab
+    try:
+        subprocess.run(
+            ["osascript", "-e", ITERM_TABS_SCRIPT, *paths],
+            check=True,
+            capture_output=True,
+        )
+    except subprocess.CalledProcessError as e:
+        console.print(f"  [red]✗[/red] {e.stderr.decode(errors='replace').strip() or e}")
+        session.close()
+        return
 
-        try:
-            subprocess.run(["osascript", "-e", script], check=True, capture_output=True)
-            console.print(f"  [green]✓[/green] {p.name}")
-        except subprocess.CalledProcessError as e:
-            console.print(f"  [red]✗[/red] {p.name}: {e}")
-
-        # Small delay to prevent overwhelming iTerm
-        if i < len(projects) - 1:
-            import time
-            time.sleep(0.3)
+    for p in projects:
+        console.print(f"  [green]✓[/green] {p.name}")
 
     console.print(f"\n[bold green]Launched {len(projects)} Claude Code sessions[/bold green]")
     session.close()
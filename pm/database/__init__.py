@@ -1,5 +1,5 @@
 """Database module for project storage."""
 
-from .models import Base, Project, ProgressItem, ScanHistory, init_db, get_session
+from .models import Base, Project, ProgressItem, ScanHistory, init_db, get_engine, get_session
 
-__all__ = ["Base", "Project", "ProgressItem", "ScanHistory", "init_db", "get_session"]
+__all__ = ["Base", "Project", "ProgressItem", "ScanHistory", "init_db", "get_engine", "get_session"]
@@ -3,11 +3,28 @@
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-from sqlalchemy import create_engine, Column, String, Float, Boolean, DateTime, Integer, Text, ForeignKey
+
+import orjson
+from sqlalchemy import (
+    create_engine, Column, String, Float, Boolean, DateTime, Integer, Text, ForeignKey, Index,
+    func, case, and_, or_, cast, event,
+)
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker, Session
 
 Base = declarative_base()
 
+PRIORITY_LABELS = {1: "Critical", 2: "High", 3: "Normal", 4: "Low", 5: "Someday"}
+
+
+def _days_since(column):
+    """SQL expression for fractional days elapsed since ``column`` (SQLite).
+
+    Python's ``timedelta.days`` floors, so ``days <= N`` is equivalent to
+    ``_days_since(column) < N + 1`` without needing a SQL floor().
+    """
+    return func.julianday("now") - func.julianday(column)
+
 
 class Project(Base):
     """Project entity."""
@@ -15,9 +32,9 @@ class Project(Base):
 
     id = Column(String, primary_key=True)
     path = Column(String, unique=True, nullable=False)
-    name = Column(String, nullable=False)
+    name = Column(String, nullable=False, index=True)
     project_type = Column(String)  # 'node', 'python', 'rust', etc.
-    category = Column(String)  # 'client', 'internal', 'tool'
+    category = Column(String, index=True)  # 'client', 'internal', 'tool'
 
     # Scan metadata
     last_scanned = Column(DateTime)
@@ -29,12 +46,12 @@ class Project(Base):
     current_status = Column(String)
     current_focus = Column(Text)
     next_action = Column(Text)
-    has_pending_decision = Column(Boolean, default=False)
+    has_pending_decision = Column(Boolean, default=False, index=True)
 
     # Git state
     git_branch = Column(String)
-    git_dirty = Column(Boolean, default=False)
-    last_commit_date = Column(DateTime)
+    git_dirty = Column(Boolean, default=False, index=True)
+    last_commit_date = Column(DateTime, index=True)
     last_commit_msg = Column(Text)
 
     # Files found
@@ -45,7 +62,7 @@ class Project(Base):
 
     # PM metadata (user-editable)
     notes = Column(Text)  # Free-form commentary
-    deadline = Column(DateTime)  # Hard deadline
+    deadline = Column(DateTime, index=True)  # Hard deadline
     target_date = Column(DateTime)  # Target completion date
     priority = Column(Integer, default=3)  # 1=critical, 2=high, 3=normal, 4=low, 5=someday
     tags = Column(Text)  # JSON list of tags
@@ -55,9 +72,24 @@ class Project(Base):
     archived = Column(Boolean, default=False)  # Hide from active lists
 
     # Relationships
-    items = relationship("ProgressItem", back_populates="project", cascade="all, delete-orphan")
+    # Ids follow insertion, so this is the order the parser produced them in
+    items = relationship(
+        "ProgressItem", back_populates="project", cascade="all, delete-orphan",
+        order_by="ProgressItem.id",
+    )
     history = relationship("ScanHistory", back_populates="project", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Serves case-insensitive exact/prefix name lookups (see name_starts_with)
+        Index("ix_projects_name_lower", func.lower(name)),
+    )
+
+    @classmethod
+    def name_starts_with(cls, text: str):
+        """Case-insensitive name prefix filter, as an index range on lower(name)."""
+        needle = text.lower()
+        return and_(func.lower(cls.name) >= needle, func.lower(cls.name) < needle + "\uffff")
+
     @property
     def days_until_deadline(self) -> Optional[int]:
         """Days until deadline (negative if overdue)."""
@@ -72,12 +104,16 @@ class Project(Base):
             return (self.target_date - datetime.utcnow()).days
         return None
 
-    @property
+    @hybrid_property
     def is_overdue(self) -> bool:
         """Check if project is past deadline."""
-        return self.days_until_deadline is not None and self.days_until_deadline < 0
+        return self.deadline is not None and self.deadline < datetime.utcnow()
 
-    @property
+    @is_overdue.expression
+    def is_overdue(cls):
+        return func.julianday(cls.deadline) < func.julianday("now")
+
+    @hybrid_property
     def urgency_score(self) -> int:
         """Calculate urgency based on deadline/priority (0-100, higher = more urgent)."""
         score = 0
@@ -112,7 +148,35 @@ class Project(Base):
 
         return min(score, 100)
 
-    @property
+    @urgency_score.expression
+    def urgency_score(cls):
+        days = -_days_since(cls.deadline)
+        target_days = -_days_since(cls.target_date)
+        score = (
+            case(
+                (func.coalesce(cls.priority, 0) != 0, func.max((6 - cls.priority) * 10, 0)),
+                else_=0,
+            )
+            + case(
+                (cls.deadline.is_(None), 0),
+                (days < 0, 50),
+                (days < 4, 40),
+                (days < 8, 30),
+                (days < 15, 20),
+                (days < 31, 10),
+                else_=0,
+            )
+            + case(
+                (or_(cls.deadline.isnot(None), cls.target_date.is_(None)), 0),
+                (target_days < 0, 20),
+                (target_days < 8, 15),
+                (target_days < 15, 10),
+                else_=0,
+            )
+        )
+        return func.min(score, 100)
+
+    @hybrid_property
     def health_score(self) -> int:
         """Calculate project health score (0-100).
 
@@ -165,20 +229,42 @@ class Project(Base):
 
         return min(score, 100)
 
+    @health_score.expression
+    def health_score(cls):
+        days_ago = _days_since(cls.last_activity)
+        score = (
+            cast(func.coalesce(cls.completion_pct, 0) * 0.3, Integer)
+            + case((cls.has_claude_md == True, 10), else_=0)
+            + case((or_(cls.has_todo == True, cls.has_progress == True), 10), else_=0)
+            + case(
+                (cls.last_activity.is_(None), 0),
+                (days_ago < 8, 20),
+                (days_ago < 15, 15),
+                (days_ago < 31, 10),
+                (days_ago < 61, 5),
+                else_=0,
+            )
+            + case((cls.has_pending_decision == True, 0), else_=10)
+            + case((cls.git_dirty == True, 0), else_=10)
+            + case(
+                (and_(func.coalesce(cls.project_type, "") != "", cls.project_type != "generic"), 10),
+                else_=0,
+            )
+        )
+        return func.min(score, 100)
+
     @property
     def priority_label(self) -> str:
         """Human-readable priority label."""
-        labels = {1: "Critical", 2: "High", 3: "Normal", 4: "Low", 5: "Someday"}
-        return labels.get(self.priority, "Normal")
+        return PRIORITY_LABELS.get(self.priority, "Normal")
 
     @property
     def tags_list(self) -> list[str]:
         """Parse tags JSON to list."""
         if self.tags:
-            import json
             try:
-                return json.loads(self.tags)
-            except:
+                return orjson.loads(self.tags)
+            except orjson.JSONDecodeError:
                 return []
         return []
 
@@ -222,6 +308,21 @@ _engine = None
 _SessionLocal = None
 
 
+def _set_sqlite_pragmas(dbapi_conn, connection_record) -> None:
+    """Tune each new SQLite connection for scan's bulk writes.
+
+    WAL lets the dashboard keep reading while a scan writes, and
+    synchronous=NORMAL is durable under WAL without an fsync per commit.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+    cursor.close()
+
+
 def _migrate_db(engine) -> None:
     """Add missing columns to existing tables."""
     from sqlalchemy import inspect, text
@@ -251,22 +352,47 @@ def _migrate_db(engine) -> None:
                 except Exception:
                     pass  # Column might already exist
 
+    # create_all() skips indexes on tables that already exist. Checked against
+    # sqlite_master directly since reflection skips expression indexes.
+    with engine.connect() as conn:
+        existing_indexes = set(conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index'")
+        ).scalars())
+    for index in Project.__table__.indexes:
+        if index.name not in existing_indexes:
+            index.create(bind=engine)
+
 
 def init_db(db_path: Optional[Path] = None) -> None:
-    """Initialize the database."""
+    """Initialize the database.
+
+    Without an explicit path, an already-initialized engine is reused so
+    repeated calls don't rebuild the pool or re-run the migration checks.
+    """
     global _engine, _SessionLocal
 
     if db_path is None:
+        if _engine is not None:
+            return
         db_path = Path(__file__).parent.parent.parent / "data" / "projects.db"
 
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
     _engine = create_engine(f"sqlite:///{db_path}", echo=False)
+    event.listen(_engine, "connect", _set_sqlite_pragmas)
     Base.metadata.create_all(_engine)
     _migrate_db(_engine)  # Add missing columns
     _SessionLocal = sessionmaker(bind=_engine)
 
 
+def get_engine():
+    """Get the database engine, initializing it on first use."""
+    if _engine is None:
+        init_db()
+
+    return _engine
+
+
 def get_session() -> Session:
     """Get a database session."""
     global _SessionLocal
@@ -10,6 +10,9 @@ from dataclasses import dataclass, field
 
 PM_STATUS_FILENAME = "PM-STATUS.md"
 
+PRIORITY_NAMES = {1: 'critical', 2: 'high', 3: 'normal', 4: 'low', 5: 'someday'}
+PRIORITY_BY_NAME = {name: level for level, name in PRIORITY_NAMES.items()}
+
 
 @dataclass
 class ProjectMetadata:
@@ -88,8 +91,7 @@ def parse_pm_status(content: str, source_file: str = None) -> ProjectMetadata:
                         metadata.priority = int(value)
                     except ValueError:
                         # Handle text priorities
-                        priority_map = {'critical': 1, 'high': 2, 'normal': 3, 'low': 4, 'someday': 5}
-                        metadata.priority = priority_map.get(value.lower(), 3)
+                        metadata.priority = PRIORITY_BY_NAME.get(value.lower(), 3)
 
                 elif key == 'deadline':
                     metadata.deadline = _parse_date(value)
@@ -138,8 +140,7 @@ def write_pm_status(project_path: Path, metadata: ProjectMetadata) -> bool:
     lines = ['---']
 
     # Priority
-    priority_labels = {1: 'critical', 2: 'high', 3: 'normal', 4: 'low', 5: 'someday'}
-    lines.append(f"priority: {metadata.priority}  # {priority_labels.get(metadata.priority, 'normal')}")
+    lines.append(f"priority: {metadata.priority}  # {PRIORITY_NAMES.get(metadata.priority, 'normal')}")
 
     # Deadline
     if metadata.deadline:
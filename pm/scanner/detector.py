@@ -59,6 +59,9 @@ class ProjectDetector:
         'target', '.idea', '.vscode', '.archive'
     }
 
+    # Commit messages are stored pre-truncated to what the dashboard shows
+    COMMIT_MSG_MAX = 60
+
     # Container folders that hold multiple projects (scan recursively)
     CONTAINER_FOLDERS = {'clients'}
 
@@ -100,6 +103,12 @@ class ProjectDetector:
                     if project:
                         projects.append(project)
 
+        # Git queries are subprocess-bound, so run them across projects at once
+        if projects:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(32, len(projects))) as pool:
+                list(pool.map(self._get_git_info, projects))
+
         return sorted(projects, key=lambda p: p.name.lower())
 
     def _scan_container(self, container_path: Path) -> list[ProjectInfo]:
@@ -147,9 +156,6 @@ class ProjectDetector:
             if (path / pf).exists():
                 project.progress_files.append(pf)
 
-        # Get git info
-        self._get_git_info(project)
-
         return project
 
     def _detect_type(self, path: Path) -> Optional[str]:
@@ -196,27 +202,30 @@ class ProjectDetector:
         project.git_initialized = True
 
         try:
-            # Get current branch
+            # Branch and dirty state from one status call: '#' lines are
+            # headers, anything else is a changed or untracked file
             result = subprocess.run(
-                ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
+                ['git', 'status', '--porcelain=v2', '--branch'],
                 cwd=project.path,
                 capture_output=True,
                 text=True,
                 timeout=5
             )
-            if result.returncode == 0:
-                project.git_branch = result.stdout.strip()
+            if result.returncode != 0:
+                return
+
+            headers = {}
+            for line in result.stdout.splitlines():
+                if line.startswith('# '):
+                    key, _, value = line[2:].partition(' ')
+                    headers[key] = value
+                else:
+                    project.git_dirty = True
 
-            # Check if dirty
-            result = subprocess.run(
-                ['git', 'status', '--porcelain'],
-                cwd=project.path,
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                project.git_dirty = bool(result.stdout.strip())
+            if headers.get('branch.oid') == '(initial)':
+                return  # No commits yet: no branch tip or last commit
+            head = headers.get('branch.head')
+            project.git_branch = 'HEAD' if head == '(detached)' else head
 
             # Get last commit
             result = subprocess.run(
@@ -231,7 +240,10 @@ class ProjectDetector:
                 if len(parts) == 2:
                     from dateutil.parser import parse
                     project.last_commit_date = parse(parts[0])
-                    project.last_commit_msg = parts[1][:100]  # Truncate
+                    msg = parts[1]
+                    if len(msg) > self.COMMIT_MSG_MAX:
+                        msg = msg[:self.COMMIT_MSG_MAX - 3] + '...'
+                    project.last_commit_msg = msg
 
         except (subprocess.TimeoutExpired, Exception):
             pass  # Git info is optional
@@ -2,6 +2,7 @@
 
 import re
 from pathlib import Path
+from datetime import datetime
 from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum
@@ -106,6 +107,13 @@ class ProgressParser:
         r'last\s+updated[:\s]+([^\n]+)',
     ]
 
+    CHECKBOX_RE = re.compile(r'^[\s-]*\[([ xX✓✅])\]\s+(.+)$')
+
+    # Decision point patterns (Option A/B sections), compiled once
+    OPTION_RE = re.compile(r'###?\s*Option\s+([A-Z])[:\s]+([^\n]+)', re.IGNORECASE)
+    RECOMMENDATION_RE = re.compile(r'(?:recommend|recommended|current recommendation)[:\s]+([^\n]+)', re.IGNORECASE)
+    DECISION_QUESTION_RE = re.compile(r'(?:decision\s+point|what\'s\s+next)[:\s]+([^\n]+)', re.IGNORECASE)
+
     # Status indicators in text
     STATUS_INDICATORS = {
         '✅': ItemStatus.COMPLETE,
@@ -133,6 +141,12 @@ class ProgressParser:
         'IMMEDIATE': ItemPriority.CRITICAL,
     }
 
+    # Files merged by parse_project, in merge order
+    PROJECT_FILES = [
+        'TODO.md', 'PROGRESS.md', 'ROADMAP.md', 'STATUS.md',
+        'DEVELOPMENT-STATUS.md', 'FUTURE.md'
+    ]
+
     def __init__(self):
         pass
 
@@ -147,7 +161,6 @@ class ProgressParser:
     def parse_content(self, content: str, source_file: Optional[str] = None) -> ProjectProgress:
         """Parse progress document content."""
         progress = ProjectProgress()
-        content_lower = content.lower()
 
         # Extract completion percentage
         progress.completion_pct = self._extract_completion(content)
@@ -193,14 +206,9 @@ class ProgressParser:
 
     def parse_project(self, project_path: Path) -> ProjectProgress:
         """Parse all progress files for a project and merge."""
-        progress_files = [
-            'TODO.md', 'PROGRESS.md', 'ROADMAP.md', 'STATUS.md',
-            'DEVELOPMENT-STATUS.md', 'FUTURE.md'
-        ]
-
         merged = ProjectProgress()
 
-        for pf in progress_files:
+        for pf in self.PROJECT_FILES:
             file_path = project_path / pf
             if file_path.exists():
                 parsed = self.parse_file(file_path)
@@ -208,6 +216,50 @@ class ProgressParser:
 
         return merged
 
+    def files_changed_since(self, project_path: Path, when: datetime) -> bool:
+        """Check whether any progress file was modified after `when` (naive UTC).
+
+        The directory itself is checked too, so added or removed files count.
+        """
+        for path in [project_path, *(project_path / pf for pf in self.PROJECT_FILES)]:
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            if datetime.utcfromtimestamp(mtime) > when:
+                return True
+        return False
+
+    @classmethod
+    def from_db(cls, project, items) -> ProjectProgress:
+        """Rebuild progress from a scanned Project row and its stored items.
+
+        Only covers what scan persists: decision details, next steps and
+        sections are not stored, and items are capped at scan time.
+        """
+        progress = ProjectProgress(
+            completion_pct=project.completion_pct,
+            current_phase=project.current_phase,
+            current_status=project.current_status,
+            current_focus=project.current_focus,
+            next_action=project.next_action,
+            has_pending_decision=bool(project.has_pending_decision),
+        )
+        progress.items = [
+            ProgressItem(
+                content=item.content,
+                status=ItemStatus(item.status),
+                priority=ItemPriority(item.priority) if item.priority else None,
+                source_file=item.source_file,
+                line_number=item.line_number,
+                item_type=item.item_type or "task",
+            )
+            for item in items
+        ]
+        progress.total_items = len(progress.items)
+        progress.completed_items = sum(1 for i in progress.items if i.status == ItemStatus.COMPLETE)
+        return progress
+
     def _extract_completion(self, content: str) -> Optional[float]:
         """Extract completion percentage from content."""
         for pattern in self.COMPLETION_PATTERNS:
@@ -246,24 +298,25 @@ class ProgressParser:
 
         for line_num, line in enumerate(lines, 1):
             # Match checkbox pattern
-            match = re.match(r'^[\s-]*\[([ xX✓✅])\]\s+(.+)$', line)
+            match = self.CHECKBOX_RE.match(line)
             if match:
                 checked = match.group(1).lower() not in [' ', '']
                 text = match.group(2).strip()
+                text_upper = text.upper()
 
                 # Determine status
                 status = ItemStatus.COMPLETE if checked else ItemStatus.PENDING
 
-                # Check for status indicators in text
+                # Check for status indicators in text (plain substring tests)
                 for indicator, ind_status in self.STATUS_INDICATORS.items():
-                    if indicator in text.upper():
+                    if indicator in text_upper:
                         status = ind_status
                         break
 
                 # Check for priority
                 priority = None
                 for indicator, ind_priority in self.PRIORITY_INDICATORS.items():
-                    if indicator in text.upper():
+                    if indicator in text_upper:
                         priority = ind_priority
                         break
 
@@ -282,21 +335,18 @@ class ProgressParser:
         decisions = []
 
         # Look for "Option A:", "Option B:" patterns
-        option_pattern = r'###?\s*Option\s+([A-Z])[:\s]+([^\n]+)'
-        matches = list(re.finditer(option_pattern, content, re.IGNORECASE))
+        matches = list(self.OPTION_RE.finditer(content))
 
         if len(matches) >= 2:
             # Group options together
             options = [f"Option {m.group(1)}: {m.group(2).strip()}" for m in matches]
 
             # Look for recommendation
-            rec_pattern = r'(?:recommend|recommended|current recommendation)[:\s]+([^\n]+)'
-            rec_match = re.search(rec_pattern, content, re.IGNORECASE)
+            rec_match = self.RECOMMENDATION_RE.search(content)
             recommendation = rec_match.group(1).strip() if rec_match else None
 
             # Look for decision question
-            question_pattern = r'(?:decision\s+point|what\'s\s+next)[:\s]+([^\n]+)'
-            q_match = re.search(question_pattern, content, re.IGNORECASE)
+            q_match = self.DECISION_QUESTION_RE.search(content)
             question = q_match.group(1).strip() if q_match else "Choose an approach"
 
             decisions.append(DecisionPoint(
@@ -1,13 +1,15 @@
 """Integration tests for pm.cli module."""
 
 import json
+import subprocess
 import pytest
 from pathlib import Path
 from datetime import datetime
 from click.testing import CliRunner
 
-from pm.cli import main
-from pm.database.models import init_db, get_session, Project, Base
+from pm.cli import main, _load_progress, _parse_filter, MAX_STORED_ITEMS
+from pm.scanner.parser import ProgressParser
+from pm.database.models import init_db, get_session, Project, ProgressItem, ScanHistory, Base
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -104,6 +106,97 @@ class TestScanCommand:
         assert "Scan Complete" in result.output
         assert "1" in result.output  # At least 1 project
 
+    def test_scan_replaces_progress_items(self, cli_runner, temp_dir):
+        """Test rescanning replaces progress items and appends history."""
+        scan_dir = temp_dir / "scan_target"
+        scan_dir.mkdir()
+
+        project = scan_dir / "test-project"
+        project.mkdir()
+        (project / "package.json").write_text('{"name": "test-project"}')
+        (project / "TODO.md").write_text("- [ ] Todo")
+
+        cli_runner.invoke(main, ["scan", str(scan_dir)])
+        (project / "TODO.md").write_text("- [x] Done\n- [ ] Todo")
+        result = cli_runner.invoke(main, ["scan", str(scan_dir)])
+        assert result.exit_code == 0
+
+        project_id = str(project.resolve())
+        session = get_session()
+        items = session.query(ProgressItem).filter_by(project_id=project_id).all()
+        history = session.query(ScanHistory).filter_by(project_id=project_id).all()
+        session.close()
+
+        assert sorted(i.status for i in items) == ["complete", "pending"]
+        assert len(history) == 2
+        assert history[-1].items_complete == 1
+
+    def test_scan_skips_unchanged_progress(self, cli_runner, temp_dir):
+        """Test rescanning unchanged projects keeps their items unless forced.
+
+        History still gets one row per scan, carrying the last counts forward.
+        """
+        scan_dir = temp_dir / "scan_target"
+        scan_dir.mkdir()
+
+        project = scan_dir / "test-project"
+        project.mkdir()
+        (project / "package.json").write_text('{"name": "test-project"}')
+        (project / "TODO.md").write_text("- [x] Done\n- [ ] Todo")
+
+        cli_runner.invoke(main, ["scan", str(scan_dir)])
+        result = cli_runner.invoke(main, ["scan", str(scan_dir)])
+        assert result.exit_code == 0
+        assert "1 with unchanged progress files" in result.output
+
+        project_id = str(project.resolve())
+        session = get_session()
+        assert session.query(ProgressItem).filter_by(project_id=project_id).count() == 2
+        history = session.query(ScanHistory).filter_by(project_id=project_id).order_by(ScanHistory.id).all()
+        assert len(history) == 2
+        assert history[1].scanned_at > history[0].scanned_at
+        assert (history[1].items_total, history[1].items_complete) == (2, 1)
+        assert history[1].completion_pct == history[0].completion_pct
+        session.close()
+
+        result = cli_runner.invoke(main, ["scan", str(scan_dir), "--force"])
+        assert result.exit_code == 0
+
+        session = get_session()
+        assert session.query(ProgressItem).filter_by(project_id=project_id).count() == 2
+        assert session.query(ScanHistory).filter_by(project_id=project_id).count() == 3
+        session.close()
+
+    def test_scan_reparses_file_edited_mid_scan(self, cli_runner, temp_dir, monkeypatch):
+        """Test a progress file edited while a scan parses it is re-parsed next scan."""
+        scan_dir = temp_dir / "scan_target"
+        scan_dir.mkdir()
+
+        project = scan_dir / "test-project"
+        project.mkdir()
+        (project / "package.json").write_text('{"name": "test-project"}')
+        (project / "TODO.md").write_text("- [ ] Todo")
+
+        parse_project = ProgressParser.parse_project
+
+        def parse_then_edit(self, path):
+            result = parse_project(self, path)
+            (path / "TODO.md").write_text("- [x] Done\n- [ ] Todo")
+            return result
+
+        monkeypatch.setattr(ProgressParser, "parse_project", parse_then_edit)
+        cli_runner.invoke(main, ["scan", str(scan_dir)])
+        monkeypatch.undo()
+
+        result = cli_runner.invoke(main, ["scan", str(scan_dir)])
+        assert result.exit_code == 0
+        assert "0 with unchanged progress files" in result.output
+
+        session = get_session()
+        items = session.query(ProgressItem).filter_by(project_id=str(project.resolve())).all()
+        session.close()
+        assert sorted(i.status for i in items) == ["complete", "pending"]
+
     def test_scan_verbose_output(self, cli_runner, temp_dir):
         """Test scan with verbose flag."""
         scan_dir = temp_dir / "scan_target"
@@ -266,6 +359,40 @@ class TestContinueCommand:
 
         assert "not found" in result.output.lower()
 
+    def _scan_project(self, cli_runner, temp_dir, files):
+        """Scan one project with the given progress files; return its DB row."""
+        project = temp_dir / "scan_target" / "test-project"
+        project.mkdir(parents=True)
+        (project / "package.json").write_text('{"name": "test-project"}')
+        for name, content in files.items():
+            (project / name).write_text(content)
+        cli_runner.invoke(main, ["scan", str(project.parent)])
+
+        session = get_session()
+        return session, session.query(Project).filter_by(name="test-project").one()
+
+    def test_load_progress_from_db_keeps_parse_order(self, cli_runner, temp_dir, monkeypatch):
+        """Test progress rebuilt from stored items matches a fresh parse."""
+        session, proj = self._scan_project(cli_runner, temp_dir, {
+            "TODO.md": "Next step: ship\n- [ ] zeta\n- [x] alpha\n",
+            "PROGRESS.md": "- [ ] beta\n- [x] gamma\n",
+        })
+        parser = ProgressParser()
+        expected = [i.content for i in parser.parse_project(Path(proj.path)).items]
+
+        monkeypatch.setattr(parser, "parse_project", lambda path: pytest.fail("re-parsed"))
+        assert [i.content for i in _load_progress(parser, proj).items] == expected
+        session.close()
+
+    def test_load_progress_reparses_at_item_cap(self, cli_runner, temp_dir):
+        """Test projects whose stored items hit the cap are parsed in full."""
+        todo = "Next step: ship\n" + "".join(f"- [ ] task {n}\n" for n in range(MAX_STORED_ITEMS + 10))
+        session, proj = self._scan_project(cli_runner, temp_dir, {"TODO.md": todo})
+
+        assert len(proj.items) == MAX_STORED_ITEMS
+        assert len(_load_progress(ProgressParser(), proj).items) == MAX_STORED_ITEMS + 10
+        session.close()
+
 
 class TestLaunchCommand:
     """Tests for the 'pm launch' command."""
@@ -302,6 +429,50 @@ class TestLaunchCommand:
         assert result.exit_code == 0
         # Command should complete
 
+    def test_launch_most_recent(self, cli_runner, populated_db):
+        """Test a numeric target launches the N most recent projects."""
+        result = cli_runner.invoke(main, ["launch", "--dry-run", "2"])
+
+        assert result.exit_code == 0
+        assert "Launching 2 project(s)" in result.output
+
+    def test_launch_dirty_only(self, cli_runner, populated_db):
+        """Test --dirty-only alone picks recent projects with uncommitted changes."""
+        result = cli_runner.invoke(main, ["launch", "--dry-run", "-d"])
+
+        assert result.exit_code == 0
+        assert "Launching 1 project(s)" in result.output
+        assert "internal-tool" in result.output
+
+    def test_launch_health_filter(self, cli_runner, populated_db):
+        """Test health filters select by computed health score."""
+        result = cli_runner.invoke(main, ["launch", "--dry-run", "--filter", "health:low"])
+        assert result.exit_code == 0
+        assert "Launching 1 project(s)" in result.output
+        assert "internal-tool" in result.output
+
+        result = cli_runner.invoke(main, ["launch", "--dry-run", "--filter", "health:attention"])
+        assert "Launching 2 project(s)" in result.output
+        assert "client-alpha" not in result.output
+
+    def test_launch_tmux(self, cli_runner, populated_db, monkeypatch):
+        """Test --tmux starts one detached session per project without a shell."""
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0)
+
+        monkeypatch.setattr("pm.cli.subprocess.run", fake_run)
+        result = cli_runner.invoke(main, ["launch", "--tmux", "client-alpha", "cli-helper"])
+
+        assert result.exit_code == 0
+        assert [c[:5] for c in calls] == [
+            ["tmux", "new-session", "-d", "-s", "claude-client-alpha"],
+            ["tmux", "new-session", "-d", "-s", "claude-cli-helper"],
+        ]
+        assert "Launched 2 project(s)" in result.output
+
     def test_launch_shows_health_scores(self, cli_runner, populated_db):
         """Test launch shows health scores in preview."""
         result = cli_runner.invoke(main, ["launch", "--dry-run", "--filter", "type:client"])
@@ -386,3 +557,21 @@ class TestErrorHandling:
 
         # Should default to name sort
         assert result.exit_code == 0
+
+    @pytest.mark.parametrize("filter_str", ["priority", "tagged", "type", "type:", "overdue:x"])
+    def test_filter_missing_value_ignored(self, cli_runner, populated_db, filter_str):
+        """Test a filter kind without its value (or a bare kind with one) is ignored."""
+        assert _parse_filter(filter_str) == (None, None)
+
+        result = cli_runner.invoke(main, ["urgent", "--filter", filter_str])
+        assert result.exit_code == 0
+
+        result = cli_runner.invoke(main, ["status", "--filter", filter_str])
+        assert result.exit_code == 0
+        assert "client-alpha" in result.output
+        assert "cli-helper" in result.output
+
+    def test_filter_value_ends_at_colon(self):
+        """Test filter values stop at a second colon."""
+        assert _parse_filter("type:client:extra") == ("type", "client")
+        assert _parse_filter("overdue") == ("overdue", None)
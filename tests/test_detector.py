@@ -1,5 +1,7 @@
 """Unit tests for pm.scanner.detector module."""
 
+import subprocess
+
 import pytest
 from pathlib import Path
 
@@ -126,6 +128,38 @@ class TestProjectDetector:
         assert len(projects) == 1
         assert projects[0].name == "project"
 
+    def test_commit_msg_truncated(self, sample_project_dir: Path):
+        """Test long commit messages are stored pre-truncated."""
+        git = ["git", "-c", "user.name=t", "-c", "user.email=t@t"]
+        subprocess.run(git + ["init", "-q"], cwd=sample_project_dir, check=True)
+        subprocess.run(git + ["add", "-A"], cwd=sample_project_dir, check=True)
+        subprocess.run(git + ["commit", "-qm", "x" * 80], cwd=sample_project_dir, check=True)
+
+        detector = ProjectDetector(sample_project_dir.parent, skip_temp_dirs=False)
+        project = detector.scan()[0]
+
+        assert project.git_initialized
+        assert len(project.last_commit_msg) == ProjectDetector.COMMIT_MSG_MAX
+        assert project.last_commit_msg.endswith("...")
+
+    def test_git_branch_and_dirty(self, sample_project_dir: Path):
+        """Test branch and dirty state are read from git status."""
+        git = ["git", "-c", "user.name=t", "-c", "user.email=t@t"]
+        subprocess.run(git + ["init", "-q", "-b", "main"], cwd=sample_project_dir, check=True)
+
+        detector = ProjectDetector(sample_project_dir.parent, skip_temp_dirs=False)
+        project = detector.scan()[0]
+        assert project.git_branch is None  # No commits yet
+        assert project.git_dirty is True
+
+        subprocess.run(git + ["add", "-A"], cwd=sample_project_dir, check=True)
+        subprocess.run(git + ["commit", "-qm", "init"], cwd=sample_project_dir, check=True)
+
+        project = detector.scan()[0]
+        assert project.git_branch == "main"
+        assert project.git_dirty is False
+        assert project.last_commit_msg == "init"
+
     def test_empty_directory(self, temp_dir: Path):
         """Test scanning empty directory returns no projects."""
         detector = ProjectDetector(temp_dir, skip_temp_dirs=False)
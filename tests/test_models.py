@@ -9,7 +9,7 @@ from sqlalchemy.orm import sessionmaker
 
 from pm.database.models import (
     Base, Project, ProgressItem, ScanHistory,
-    init_db, get_session
+    init_db, get_engine, get_session
 )
 
 
@@ -332,6 +332,22 @@ class TestDatabaseInit:
 
         session.close()
 
+    def test_get_engine_reuses_engine(self, temp_dir):
+        """Test that get_engine returns the engine created by init_db."""
+        init_db(temp_dir / "test.db")
+        engine = get_engine()
+
+        assert engine is get_engine()
+        assert str(temp_dir / "test.db") in str(engine.url)
+
+    def test_init_db_enables_wal(self, temp_dir):
+        """Test that connections from init_db use WAL journaling."""
+        init_db(temp_dir / "test.db")
+
+        with get_engine().connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+
     def test_get_session_auto_init(self):
         """Test that get_session auto-initializes if not initialized."""
         # This uses the default path
@@ -406,3 +422,53 @@ class TestProjectQueries:
         ).all()
 
         assert len(results) == 2
+
+    def test_name_starts_with(self, db_session, multiple_projects):
+        """Test case-insensitive prefix lookup by name."""
+        results = db_session.query(Project).filter(
+            Project.name_starts_with("CLIENT-")
+        ).order_by(Project.name).all()
+
+        assert [p.name for p in results] == ["client-alpha", "client-beta"]
+        assert db_session.query(Project).filter(Project.name_starts_with("alpha")).count() == 0
+
+
+class TestScoreExpressions:
+    """Tests for the SQL forms of the computed score properties."""
+
+    def test_health_score_sql_matches_python(self, db_session, multiple_projects):
+        """Test that health_score computed in SQL equals the Python property."""
+        rows = dict(db_session.query(Project.id, Project.health_score).all())
+        for p in multiple_projects:
+            assert rows[p.id] == p.health_score
+
+    def test_urgency_score_sql_matches_python(self, db_session, multiple_projects):
+        """Test that urgency_score computed in SQL equals the Python property."""
+        now = datetime.utcnow()
+        offsets = [-5, 2, 10, None]
+        for p, offset in zip(multiple_projects, offsets):
+            p.priority = multiple_projects.index(p) + 1
+            if offset is not None:
+                p.deadline = now + timedelta(days=offset, hours=12)
+            else:
+                p.target_date = now + timedelta(days=6, hours=12)
+        db_session.commit()
+
+        rows = dict(db_session.query(Project.id, Project.urgency_score).all())
+        for p in multiple_projects:
+            assert rows[p.id] == p.urgency_score
+
+    def test_order_by_health_score(self, db_session, multiple_projects):
+        """Test ordering by health_score in SQL."""
+        projects = db_session.query(Project).order_by(Project.health_score.desc()).all()
+        scores = [p.health_score for p in projects]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_filter_overdue(self, db_session, multiple_projects):
+        """Test filtering overdue projects in SQL."""
+        multiple_projects[0].deadline = datetime.utcnow() - timedelta(days=1)
+        multiple_projects[1].deadline = datetime.utcnow() + timedelta(days=1)
+        db_session.commit()
+
+        overdue = db_session.query(Project).filter(Project.is_overdue).all()
+        assert [p.name for p in overdue] == ["client-alpha"]
@@ -1,12 +1,14 @@
 """Unit tests for pm.scanner.parser module."""
 
 import pytest
+from datetime import datetime, timedelta
 from pathlib import Path
 
 from pm.scanner.parser import (
     ProgressParser, ProjectProgress, ProgressItem,
     ItemStatus, ItemPriority, DecisionPoint, parse_progress
 )
+from pm.database import models
 
 
 class TestProgressParser:
@@ -290,6 +292,34 @@ class TestParseProject:
         assert result.completion_pct is None
         assert result.items == []
 
+    def test_files_changed_since(self, parser, sample_project_dir):
+        """Test progress file mtimes are compared against a UTC timestamp."""
+        now = datetime.utcnow()
+        assert parser.files_changed_since(sample_project_dir, now - timedelta(hours=1))
+        assert not parser.files_changed_since(sample_project_dir, now + timedelta(hours=1))
+
+    def test_from_db(self):
+        """Test rebuilding progress from stored project state."""
+        project = models.Project(
+            completion_pct=50.0,
+            current_phase="Phase 2",
+            next_action="Ship it",
+            has_pending_decision=False,
+        )
+        items = [
+            models.ProgressItem(content="Done", status="complete", priority="high", source_file="TODO.md"),
+            models.ProgressItem(content="Next", status="pending", source_file="TODO.md"),
+        ]
+
+        result = ProgressParser.from_db(project, items)
+
+        assert result.completion_pct == 50.0
+        assert result.current_phase == "Phase 2"
+        assert result.next_action == "Ship it"
+        assert [i.status for i in result.items] == [ItemStatus.COMPLETE, ItemStatus.PENDING]
+        assert result.items[0].priority == ItemPriority.HIGH
+        assert result.completed_items == 1
+
 
 class TestMergeProgress:
     """Tests for merging progress objects."""